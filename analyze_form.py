@@ -6,7 +6,6 @@ Dijidemi form elemanlarını analiz eder
 import asyncio
 from src.agents.executor import ExecutorAgent
 
-
 async def analyze_form():
     """Dijidemi login form elemanlarını analiz eder"""
     
@@ -32,68 +31,23 @@ async def analyze_form():
         print("🌐 Dijidemi.com/Login sayfasına gidiliyor...")
         goto_result = await executor._execute_goto("https://dijidemi.com/Login")
         print(f"✅ Sayfa yüklendi: {goto_result['current_url']}")
-        
-        # 3 saniye bekle
-        await asyncio.sleep(3)
-        
+
+        # Event-driven settle: sabit sleep yerine DOM sakinleşene kadar bekle
+        await executor.wait_for_settle(timeout_ms=3000, quiet_ms=500)
+
         # Form elemanlarını analiz et
         print("🔍 Form elemanları analiz ediliyor...")
-        
-        js_script = """
-        () => {
-            const inputs = Array.from(document.querySelectorAll('input'));
-            const buttons = Array.from(document.querySelectorAll('button'));
-            const selects = Array.from(document.querySelectorAll('select'));
-            
-            const formElements = [];
-            
-            inputs.forEach((input, index) => {
-                formElements.push({
-                    type: 'input',
-                    index: index,
-                    id: input.id || 'no-id',
-                    name: input.name || 'no-name',
-                    placeholder: input.placeholder || 'no-placeholder',
-                    value: input.value || 'no-value',
-                    type_attr: input.type || 'no-type',
-                    className: input.className || 'no-class',
-                    ariaLabel: input.getAttribute('aria-label') || 'no-aria-label',
-                    outerHTML: input.outerHTML.substring(0, 200)
-                });
-            });
-            
-            buttons.forEach((button, index) => {
-                formElements.push({
-                    type: 'button',
-                    index: index,
-                    id: button.id || 'no-id',
-                    text: button.textContent.trim() || 'no-text',
-                    className: button.className || 'no-class',
-                    ariaLabel: button.getAttribute('aria-label') || 'no-aria-label',
-                    outerHTML: button.outerHTML.substring(0, 200)
-                });
-            });
-            
-            selects.forEach((select, index) => {
-                formElements.push({
-                    type: 'select',
-                    index: index,
-                    id: select.id || 'no-id',
-                    name: select.name || 'no-name',
-                    className: select.className || 'no-class',
-                    ariaLabel: select.getAttribute('aria-label') || 'no-aria-label',
-                    outerHTML: select.outerHTML.substring(0, 200)
-                });
-            });
-            
-            return formElements;
-        }
-        """
-        
-        js_result = await executor.evaluate_javascript_tool(js_script)
-        
+
+        # Ortak tek-geçiş tarama: form metadata'sı + login adayları aynı sonuçtan
+        # JS analizi ve screenshot browser tarafında bağımsız: paralel çalıştır
+        js_task = asyncio.create_task(executor.scan_page_interactive())
+        ss_task = asyncio.create_task(executor.take_screenshot_tool("form_analysis.png"))
+        js_result, screenshot_result = await asyncio.gather(js_task, ss_task)
+
         if js_result["status"] == "success":
-            elements = js_result["result"]
+            analysis = js_result["result"]
+            elements = analysis["formElements"]
+            print(f"📡 Sayfa durumu: {analysis['readyState']}")
             print(f"\n📋 Bulunan {len(elements)} form elemanı:")
             print("=" * 80)
             
@@ -115,9 +69,7 @@ async def analyze_form():
         else:
             print(f"❌ JavaScript hatası: {js_result['message']}")
             
-        # Screenshot al
-        print("\n📸 Screenshot alınıyor...")
-        screenshot_result = await executor.take_screenshot_tool("form_analysis.png")
+        # Screenshot analizle paralel alındı, sadece sonucu raporla
         if screenshot_result["status"] == "success":
             print(f"✅ Screenshot kaydedildi: {screenshot_result['path']}")
         
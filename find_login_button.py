@@ -6,7 +6,6 @@ Dijidemi Giriş Yap butonunu bulur
 import asyncio
 from src.agents.executor import ExecutorAgent
 
-
 async def find_login_button():
     """Giriş Yap butonunu bulur"""
     
@@ -31,58 +30,29 @@ async def find_login_button():
         # Dijidemi login sayfasına git
         print("🌐 Dijidemi.com/Login sayfasına gidiliyor...")
         await executor._execute_goto("https://dijidemi.com/Login")
-        
-        # 3 saniye bekle
-        await asyncio.sleep(3)
-        
-        # Tüm butonları, linkleri ve form elemanlarını ara
-        js_script = """
-        () => {
-            const elements = [];
-            
-            // Tüm button, input[type=submit], input[type=button], a elemanlarını ara
-            const allElements = document.querySelectorAll('button, input[type=submit], input[type=button], a, [onclick], .btn');
-            
-            allElements.forEach((el, index) => {
-                const text = el.textContent.trim();
-                const onClick = el.getAttribute('onclick') || '';
-                const className = el.className || '';
-                const id = el.id || '';
-                
-                // "Giriş", "Login", "Oturum" gibi kelimeler ara
-                if (text.toLowerCase().includes('giriş') || 
-                    text.toLowerCase().includes('login') || 
-                    text.toLowerCase().includes('oturum') ||
-                    onClick.toLowerCase().includes('login') ||
-                    className.toLowerCase().includes('login') ||
-                    id.toLowerCase().includes('login') ||
-                    text.includes('Gir')) {
-                    
-                    elements.push({
-                        index: index,
-                        tagName: el.tagName.toLowerCase(),
-                        id: id,
-                        className: className,
-                        text: text,
-                        onclick: onClick,
-                        type: el.type || 'no-type',
-                        href: el.href || 'no-href',
-                        outerHTML: el.outerHTML.substring(0, 300)
-                    });
-                }
-            });
-            
-            return elements;
-        }
-        """
-        
-        js_result = await executor.evaluate_javascript_tool(js_script)
-        
+
+        # Event-driven settle: sabit sleep yerine DOM sakinleşene kadar bekle
+        await executor.wait_for_settle(timeout_ms=3000, quiet_ms=500)
+
+        # Ortak tek-geçiş tarama: login adayları aynı sonuçtan okunur
+        js_result = await executor.scan_page_interactive()
+
         if js_result["status"] == "success":
-            elements = js_result["result"]
+            analysis = js_result["result"]
+            elements = analysis["loginCandidates"]
+            print(f"📡 Sayfa durumu: {analysis['readyState']}")
+
+            if analysis.get("highConfidence") and elements:
+                # Kesin eşleşme bulundu, detaylı diagnostic dökümüne gerek yok
+                element = elements[0]
+                print(f"\n🎯 Yüksek güvenli eşleşme (score={element['score']}): "
+                      f"{element['tagName'].upper()} '{element['text']}'")
+                print(f"   ID: {element['id']}, Class: {element['className']}")
+                return
+
             print(f"\n📋 Bulunan {len(elements)} giriş ile ilgili element:")
             print("=" * 80)
-            
+
             for element in elements:
                 print(f"\n🔹 {element['tagName'].upper()} #{element['index']}")
                 print(f"   ID: {element['id']}")
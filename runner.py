@@ -11,11 +11,20 @@ from pathlib import Path
 from typing import Optional, List
 import json
 
+try:
+    # Büyük sonuç ağaçları için C-level encoder (opsiyonel bağımlılık)
+    import orjson
+except ImportError:
+    orjson = None
+
+from playwright.async_api import async_playwright
+
 # Local imports
 from src.utils.config import Config
 from src.utils.logger import setup_logging, create_test_log_file, TestLogger
 from src.utils.yaml_loader import YamlLoader
 from src.agents.crew_manager import CrewManager
+from src.agents.executor import DEFAULT_CHROMIUM_ARGS
 
 
 class TestRunner:
@@ -28,7 +37,11 @@ class TestRunner:
         self.config = config
         self.crew_manager = None
         self.logger = None
-        
+
+        # Scenariolar arası paylaşılan browser (context-per-scenario pattern)
+        self._playwright = None
+        self._browser = None
+
     async def initialize(self):
         """Runner'ı başlat"""
         # Dizinleri oluştur
@@ -53,23 +66,49 @@ class TestRunner:
             headless=self.config.headless
         )
         
+        # Tek browser launch: her scenario kendi context'ini açar, process
+        # tree'yi yeniden oluşturma maliyeti amortize edilir
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.config.headless,
+            args=DEFAULT_CHROMIUM_ARGS
+        )
+
         self.logger.info("Test runner başlatıldı", config=self.config.get_all_config())
+
+    async def close(self):
+        """Paylaşılan browser kaynaklarını kapat"""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
     
-    async def run_single_scenario(self, scenario_path: str) -> dict:
+    async def run_single_scenario(self,
+                                  scenario_path: str,
+                                  crew_manager: Optional[CrewManager] = None,
+                                  validation: Optional[dict] = None) -> dict:
         """
         Tek bir YAML scenario çalıştır
-        
+
         Args:
             scenario_path: YAML dosya yolu
-            
+            crew_manager: Kullanılacak CrewManager (default: paylaşılan instance)
+            validation: Önceden hesaplanmış validation sonucu (varsa dosya
+                        yeniden parse edilmez)
+
         Returns:
             Test sonuçları
         """
+        crew_manager = crew_manager or self.crew_manager
         self.logger.start_test()
-        
+
         try:
-            # Scenario dosyasını validate et
-            validation = YamlLoader.validate_scenario_syntax(scenario_path)
+            # Scenario dosyasını validate et (önceden validate edilmediyse)
+            if validation is None:
+                validation = YamlLoader.validate_scenario_syntax(scenario_path)
             if not validation["valid"]:
                 self.logger.error("Scenario validation başarısız", 
                                 errors=validation["errors"])
@@ -82,8 +121,8 @@ class TestRunner:
                            scenario_name=validation.get("scenario_name"),
                            steps_count=validation.get("steps_count"))
             
-            # Test'i çalıştır
-            result = await self.crew_manager.run_scenario(scenario_path)
+            # Test'i çalıştır (paylaşılan browser üzerinde yeni context ile)
+            result = await crew_manager.run_scenario(scenario_path, browser=self._browser)
             
             # Sonucu logla
             status = result.get("summary", {}).get("overall_status", "unknown")
@@ -100,13 +139,15 @@ class TestRunner:
                 "error": str(e)
             }
     
-    async def run_multiple_scenarios(self, directory: str) -> List[dict]:
+    async def run_multiple_scenarios(self, directory: str, on_result=None) -> List[dict]:
         """
         Dizindeki tüm senaryoları çalıştır
-        
+
         Args:
             directory: Test dizini
-            
+            on_result: Her scenario tamamlandığında çağrılan callback
+                       (sonuçları biriktirmeden stream etmek için)
+
         Returns:
             Tüm test sonuçları
         """
@@ -116,41 +157,92 @@ class TestRunner:
             self.logger.error("Çalıştırılacak scenario bulunamadı", directory=directory)
             return []
         
-        self.logger.info("Çoklu scenario execution başlıyor", 
-                        scenario_count=len(scenarios))
-        
-        results = []
-        
-        for i, scenario in enumerate(scenarios):
-            scenario_path = Path(directory) / f"{scenario.name}.yaml"
-            
-            self.logger.info("Scenario çalıştırılıyor", 
-                           index=i+1, 
-                           total=len(scenarios),
-                           name=scenario.name)
-            
-            result = await self.run_single_scenario(str(scenario_path))
-            results.append(result)
-            
-            # Kısa bir break ver
-            if i < len(scenarios) - 1:
-                await asyncio.sleep(1)
-        
+        # Tüm YAML'ları baştan paralel validate et: bozuk dosyalar execution
+        # başlamadan elenir, geçerli sonuçlar run_single_scenario'ya taşınır
+        scenario_paths = [str(Path(directory) / f"{s.name}.yaml") for s in scenarios]
+        validations = await asyncio.gather(*[
+            asyncio.to_thread(YamlLoader.validate_scenario_syntax, path)
+            for path in scenario_paths
+        ])
+
+        runnable = []
+        for scenario, path, validation in zip(scenarios, scenario_paths, validations):
+            if validation["valid"]:
+                runnable.append((scenario, path, validation))
+            else:
+                self.logger.error("Scenario validation başarısız",
+                                path=path,
+                                errors=validation["errors"])
+
+        if not runnable:
+            self.logger.error("Geçerli scenario bulunamadı", directory=directory)
+            return []
+
+        max_parallel = self.config.max_parallel_scenarios
+
+        self.logger.info("Çoklu scenario execution başlıyor",
+                        scenario_count=len(runnable),
+                        max_parallel=max_parallel)
+
+        # CrewManager'ı scenario başına yeniden kurmak yerine worker slot başına
+        # bir instance havuzla; havuz boyutu aynı zamanda paralelliği sınırlar
+        manager_pool: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(max_parallel, len(runnable))):
+            manager_pool.put_nowait(CrewManager(
+                llm_model="gpt-4o-mini",
+                headless=self.config.headless
+            ))
+
+        async def _run_bounded(index: int, scenario, scenario_path: str, validation: dict) -> dict:
+            crew_manager = await manager_pool.get()
+            try:
+                self.logger.info("Scenario çalıştırılıyor",
+                               index=index+1,
+                               total=len(runnable),
+                               name=scenario.name)
+
+                crew_manager.reset_scenario_state()
+                result = await self.run_single_scenario(scenario_path,
+                                                        crew_manager=crew_manager,
+                                                        validation=validation)
+
+                # Sonucu tamamlanır tamamlanmaz stream et
+                if on_result:
+                    on_result(result)
+
+                return result
+            finally:
+                manager_pool.put_nowait(crew_manager)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_run_bounded(i, scenario, path, validation))
+                     for i, (scenario, path, validation) in enumerate(runnable)]
+
+        results = [task.result() for task in tasks]
+
         # Özet rapor
         self._log_summary_report(results)
-        
+
         return results
     
-    def _log_summary_report(self, results: List[dict]):
-        """Çoklu test sonuçları için özet rapor"""
+    def _log_summary_report(self, results: List[dict]) -> None:
+        """Çoklu test sonuçları için özet rapor (tek geçişte sayar)"""
         total_tests = len(results)
-        passed = len([r for r in results if r.get("summary", {}).get("overall_status") == "passed"])
-        failed = total_tests - passed
-        
+        passed = failed = errored = 0
+
+        for r in results:
+            if r.get("summary", {}).get("overall_status") == "passed":
+                passed += 1
+            elif r.get("status") == "error":
+                errored += 1
+            else:
+                failed += 1
+
         self.logger.info("Test execution tamamlandı",
                         total_tests=total_tests,
                         passed=passed,
                         failed=failed,
+                        errored=errored,
                         success_rate=passed/total_tests if total_tests > 0 else 0)
 
 
@@ -234,21 +326,18 @@ async def main():
     args = parser.parse_args()
     
     try:
-        # Config'i yükle
-        config = Config(env_file=args.config)
-        
-        # CLI argument'larıyla override et
+        # CLI argument'ları Config'e override olarak geçirilir
+        # (os.environ'a yazmak Config kurulduktan sonra etkisiz kalıyordu)
+        overrides = {}
         if args.headful:
-            import os
-            os.environ["HEADLESS"] = "false"
-            
+            overrides["HEADLESS"] = "false"
         if args.log_level:
-            import os
-            os.environ["LOG_LEVEL"] = args.log_level
-            
+            overrides["LOG_LEVEL"] = args.log_level
         if args.log_format:
-            import os
-            os.environ["LOG_FORMAT"] = args.log_format
+            overrides["LOG_FORMAT"] = args.log_format
+
+        # Config'i yükle
+        config = Config(env_file=args.config, overrides=overrides)
         
         # Özel komutlar
         if args.create_example:
@@ -276,35 +365,60 @@ async def main():
         # Test runner'ı başlat
         runner = TestRunner(config)
         await runner.initialize()
-        
+
+        # Output dosyasını run'dan önce aç: sonuçlar biriktirilmeden,
+        # scenario tamamlandıkça NDJSON satırı olarak yazılır
+        output_fp = None
+        if args.output:
+            output_path = Path(args.output)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_fp = open(output_path, 'w', encoding='utf-8')
+
+        def _write_result(result):
+            # ScenarioResult dataclass'ı serialize öncesi dict'e çevrilir
+            payload = result.to_dict() if hasattr(result, "to_dict") else result
+            if orjson is not None:
+                line = orjson.dumps(payload, default=str).decode('utf-8')
+            else:
+                line = json.dumps(payload, ensure_ascii=False, default=str)
+            output_fp.write(line + '\n')
+
         # Test'leri çalıştır
         results = None
-        
-        if args.file:
-            print(f"🚀 Scenario çalıştırılıyor: {args.file}")
-            results = [await runner.run_single_scenario(args.file)]
-            
-        elif args.directory:
-            print(f"🚀 Dizindeki senaryolar çalıştırılıyor: {args.directory}")
-            results = await runner.run_multiple_scenarios(args.directory)
-        
-        # Sonuçları kaydet
+
+        try:
+            if args.file:
+                print(f"🚀 Scenario çalıştırılıyor: {args.file}")
+                results = [await runner.run_single_scenario(args.file)]
+
+                if output_fp:
+                    _write_result(results[0])
+
+            elif args.directory:
+                print(f"🚀 Dizindeki senaryolar çalıştırılıyor: {args.directory}")
+                results = await runner.run_multiple_scenarios(
+                    args.directory,
+                    on_result=_write_result if output_fp else None
+                )
+        finally:
+            await runner.close()
+
+            if output_fp:
+                output_fp.close()
+
         if args.output and results:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(results, f, indent=2, ensure_ascii=False, default=str)
-            
             print(f"📊 Test sonuçları kaydedildi: {args.output}")
         
-        # Exit code belirle
+        # Exit code belirle (ara liste kurmadan tek geçişte say)
         if results:
-            failed_tests = [r for r in results if r.get("status") == "error" or 
-                           r.get("summary", {}).get("overall_status") in ["failed", "partially_failed"]]
-            
-            if failed_tests:
-                print(f"❌ {len(failed_tests)} test başarısız")
+            failed_count = sum(
+                1 for r in results
+                if r.get("status") == "error" or
+                r.get("summary", {}).get("overall_status") in ("failed", "partially_failed")
+            )
+
+            if failed_count:
+                print(f"❌ {failed_count} test başarısız")
                 return 1
             else:
                 print(f"✅ Tüm testler başarılı")
@@ -328,7 +442,15 @@ if __name__ == "__main__":
     # Windows için event loop policy ayarla
     if sys.platform.startswith('win'):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-    
-    # Ana fonksiyonu çalıştır
-    exit_code = asyncio.run(main())
-    sys.exit(exit_code) 
\ No newline at end of file
+    else:
+        # POSIX'te uvloop kuruluysa CDP WebSocket trafiğini hızlandırır (opsiyonel)
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+
+    # Ana fonksiyonu çalıştır (Runner: aynı loop cleanup için de kullanılır)
+    with asyncio.Runner() as loop_runner:
+        exit_code = loop_runner.run(main())
+    sys.exit(exit_code)
\ No newline at end of file
@@ -3,11 +3,24 @@ Crew Manager
 Tüm agent'ları orkestra eder ve test execution workflow'unu yönetir.
 """
 
+import asyncio
+import copy
+import functools
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from typing import Dict, Any, Optional
 import structlog
 import yaml
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from playwright.async_api import Browser, async_playwright
 
 from .planner import PlannerAgent
 from .executor import ExecutorAgent
@@ -15,6 +28,89 @@ from .verifier import VerifierAgent
 
 logger = structlog.get_logger(__name__)
 
+# Status sözlüğü: intern'li sabitler hot path'teki eşitlik kontrollerini
+# pointer karşılaştırması fast path'ine düşürür (değerler JSON'da aynı kalır)
+STATUS_SUCCESS = sys.intern("success")
+STATUS_ERROR = sys.intern("error")
+STATUS_RECOVERED = sys.intern("recovered")
+STATUS_ABORT = sys.intern("abort")
+
+# libyaml varsa C loader'ı kullan (pure-Python parser'dan belirgin hızlı)
+_YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _normalize_steps(steps: list, env: Optional[str] = None) -> tuple:
+    """
+    Step listesini bir kez normalize eder
+
+    enabled: false / skip: true işaretli ve only_in ile başka ortama
+    kilitlenmiş step'ler burada düşer; üç faz da kısalmış listeyi gezer.
+    """
+    kept = []
+    dropped_disabled = 0
+    dropped_env = 0
+
+    for step in steps:
+        if not isinstance(step, dict):
+            kept.append(step)
+            continue
+        if step.get("enabled") is False or step.get("skip") is True:
+            dropped_disabled += 1
+            continue
+        only_in = step.get("only_in")
+        if only_in and only_in != env:
+            dropped_env += 1
+            continue
+        kept.append(step)
+
+    return kept, dropped_disabled, dropped_env
+
+
+@functools.lru_cache(maxsize=128)
+def _load_scenario_cached(file_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """(path, mtime, size) anahtarlı parse cache'i — aynı dosya tekrar parse edilmez"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=_YamlSafeLoader)
+
+
+@dataclass(slots=True)
+class ScenarioResult:
+    """
+    Tek senaryonun final sonucu
+
+    Slot'lu dataclass: büyük nested dict'i bir kez referansla tutar,
+    attribute erişimi dict lookup'tan ucuzdur. Mevcut çağıranlar sonucu
+    dict gibi okuduğu için mapping shim'leri sağlanır; serialize etmek
+    isteyen to_dict() kullanır.
+    """
+    metadata: Dict[str, Any]
+    summary: Dict[str, Any]
+    execution: Dict[str, Any]
+    verification: Dict[str, Any]
+    report: Dict[str, Any]
+    context: Dict[str, Any]
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def keys(self):
+        return (f.name for f in fields(self))
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and hasattr(self, key)
+
+    def __iter__(self):
+        return self.keys()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class CrewManager:
     """
@@ -30,22 +126,73 @@ class CrewManager:
         self.llm_model = llm_model
         self.headless = headless
         
-        # Agent'ları başlat
+        # Agent'lar bir kez kurulur ve run_scenario çağrıları arasında
+        # yeniden kullanılır (LLM client setup / tool kaydı tekrarlanmaz)
         self.planner = PlannerAgent(llm_model=llm_model)
         self.executor = ExecutorAgent(llm_model=llm_model, headless=headless)
         self.verifier = VerifierAgent(llm_model=llm_model)
+
+        # Planner sonuçları scenario hash'ine göre memoize edilir:
+        # aynı senaryonun rerun'ında (CI retry, flake avı) planner
+        # round-trip'i tamamen atlanır
+        self._plan_cache: OrderedDict = OrderedDict()
+        self._plan_cache_size = 32
+
+        # async with CrewManager(...) kullanımında sıcak tutulan browser:
+        # her run_scenario çağrısı cold-start yerine yeni context açar
+        self._playwright = None
+        self._owned_browser: Optional[Browser] = None
+
+    async def __aenter__(self) -> "CrewManager":
+        """Scenariolar arası paylaşılacak browser'ı bir kez başlatır"""
+        self._playwright = await async_playwright().start()
+        self._owned_browser = await self._playwright.chromium.launch(headless=self.headless)
+        self.logger.info("Paylaşılan browser başlatıldı", headless=self.headless)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Paylaşılan browser'ı kapatır"""
+        if self._owned_browser:
+            await self._owned_browser.close()
+            self._owned_browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    def reset_scenario_state(self) -> None:
+        """
+        Scenariolar arası taşınmaması gereken state'i sıfırlar
+
+        Agent instance'ları korunur; sadece executor'ın per-scenario
+        browser referansları ve script cache'i temizlenir.
+        """
+        self.executor.context = None
+        self.executor.page = None
+        self.executor._injected_scripts.clear()
     
-    async def run_scenario(self, scenario_path: str) -> Dict[str, Any]:
+    async def run_scenario(self,
+                           scenario_path: str,
+                           browser: Optional[Browser] = None,
+                           on_step=None) -> Dict[str, Any]:
         """
         YAML test senaryosunu çalıştırır
-        
+
         Args:
             scenario_path: YAML dosya yolu
-            
+            browser: Paylaşılan Browser instance'ı (varsa scenario sadece
+                     kendi context'ini açar/kapatır)
+            on_step: Her step sonucu hazır olur olmaz çağrılan callback;
+                     canlı rapor/dashboard beslemek için (runner'daki
+                     on_result ile aynı sözleşme)
+
         Returns:
             Toplam test sonuçları
         """
         self.logger.info("Test senaryosu çalıştırılıyor", scenario_path=scenario_path)
+
+        # Dışarıdan browser verilmediyse context manager'ın sıcak browser'ı
+        # kullanılır (varsa); ikisi de yoksa executor kendi browser'ını açar
+        browser = browser or self._owned_browser
         
         # YAML dosyasını yükle
         scenario_data = self._load_scenario(scenario_path)
@@ -57,6 +204,7 @@ class CrewManager:
             "scenario_path": scenario_path,
             "scenario_data": scenario_data,
             "start_time": datetime.now(),
+            "start_perf_ns": time.perf_counter_ns(),
             "status": "running"
         }
         
@@ -65,17 +213,22 @@ class CrewManager:
             self.logger.info("Planning fazı başlıyor")
             planning_result = await self._run_planning_phase(scenario_data, execution_context)
             
-            if planning_result["status"] != "success":
+            if planning_result["status"] != STATUS_SUCCESS:
                 return {"status": "planning_failed", "error": planning_result.get("error")}
             
             # 2. EXECUTION PHASE  
             self.logger.info("Execution fazı başlıyor")
-            execution_result = await self._run_execution_phase(scenario_data, planning_result, execution_context)
+            execution_result = await self._run_execution_phase(
+                scenario_data, planning_result, execution_context,
+                browser=browser, on_step=on_step
+            )
             
             # 3. VERIFICATION PHASE
             self.logger.info("Verification fazı başlıyor")
-            verification_result = await self._run_verification_phase(scenario_data, execution_result, execution_context)
-            
+            verification_result = await self._run_verification_phase(
+                scenario_data, execution_result, execution_context
+            )
+
             # 4. FINALIZATION
             final_result = self._finalize_results(scenario_data, execution_result, verification_result, execution_context)
             
@@ -90,21 +243,43 @@ class CrewManager:
             return {
                 "status": "error",
                 "error": str(e),
-                "context": execution_context
+                # Scratch context'in tamamı değil, sadece rapora yarayan
+                # scalar'lar dışarı verilir
+                "context": {
+                    "scenario_path": execution_context["scenario_path"],
+                    "start_time": execution_context["start_time"].isoformat()
+                }
             }
     
     async def _run_planning_phase(self, scenario_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        """Planning fazını çalıştırır"""
-        
+        """Planning fazını çalıştırır (scenario hash'iyle memoize edilir)"""
+
         try:
-            # Analysis çalıştır
-            analysis_result = self.planner.analyze_scenario_tool(scenario_data)
+            cache_key = self._scenario_cache_key(scenario_data)
+            cached = self._plan_cache.get(cache_key)
+
+            if cached is not None:
+                # Cache'teki ağaç paylaşılmasın diye kopya verilir
+                self._plan_cache.move_to_end(cache_key)
+                analysis_result, execution_plan = copy.deepcopy(cached)
+                self.logger.info("Planning cache hit", cache_key=cache_key)
+            else:
+                # Analysis çalıştır (sync tool'lar event loop'u bloklamasın
+                # diye thread'e alınır)
+                analysis_result = await asyncio.to_thread(self.planner.analyze_scenario_tool, scenario_data)
+
+                # Plan oluştur
+                execution_plan = await asyncio.to_thread(
+                    self.planner.create_execution_plan_tool, scenario_data, analysis_result
+                )
+
+                self._plan_cache[cache_key] = copy.deepcopy((analysis_result, execution_plan))
+                if len(self._plan_cache) > self._plan_cache_size:
+                    self._plan_cache.popitem(last=False)
+
             context["analysis"] = analysis_result
-            
-            # Plan oluştur
-            execution_plan = self.planner.create_execution_plan_tool(scenario_data, analysis_result)
             context["execution_plan"] = execution_plan
-            
+
             return {
                 "status": "success",
                 "analysis": analysis_result,
@@ -114,75 +289,141 @@ class CrewManager:
         except Exception as e:
             self.logger.error("Planning fazı hatası", error=str(e))
             return {"status": "error", "error": str(e)}
+
+    def _scenario_cache_key(self, scenario_data: Dict[str, Any]) -> str:
+        """Normalize edilmiş scenario içeriğinden stabil cache anahtarı üretir"""
+        digest = hashlib.blake2b(
+            json.dumps(scenario_data, sort_keys=True, default=str).encode(),
+            digest_size=16
+        ).hexdigest()
+        # Model değişirse plan da geçersiz sayılır
+        return f"{digest}:{self.llm_model}"
     
-    async def _run_execution_phase(self, 
-                                 scenario_data: Dict[str, Any], 
+    async def _run_execution_phase(self,
+                                 scenario_data: Dict[str, Any],
                                  planning_result: Dict[str, Any],
-                                 context: Dict[str, Any]) -> Dict[str, Any]:
+                                 context: Dict[str, Any],
+                                 browser: Optional[Browser] = None,
+                                 on_step=None) -> Dict[str, Any]:
         """Execution fazını çalıştırır"""
         
         execution_plan = planning_result["execution_plan"]
         steps = scenario_data.get("steps", [])
         
         # Browser'ı başlat
+        browser_type = scenario_data.get("browser", "chromium")
         browser_config = {
-            "browser": scenario_data.get("browser", "chromium"),
+            "browser": browser_type,
             "headless": scenario_data.get("headless", self.headless),
             "timeout": scenario_data.get("timeout", 30000)
         }
         
-        init_result = await self.executor.initialize_browser_tool(browser_config)
-        if init_result["status"] != "success":
+        # Paylaşılan browser Chromium launch'ıdır; senaryo firefox/webkit
+        # istiyorsa executor kendi launch path'ine düşsün
+        shared_browser = browser if browser_type == "chromium" else None
+        init_result = await self.executor.initialize_browser_tool(browser_config, browser=shared_browser)
+        if init_result["status"] != STATUS_SUCCESS:
             return {"status": "browser_init_failed", "error": init_result["message"]}
         
-        # Step'leri çalıştır
+        # Step'leri çalıştır; plandaki parallel_groups üyeleri gather ile
+        # eşzamanlı, diğerleri sırayla yürür
+        parallel_start = {g[0]: g for g in execution_plan.get("parallel_groups", [])}
         step_results = []
+        # SoA kolonları: verification fazı step listesini yeniden taramadan
+        # doğrudan bu indekslerden okur
+        actions = []
+        statuses = []
+        assertion_indices = []
+        failed_indices = []
         total_duration = 0.0
-        
-        for i, step in enumerate(steps):
-            step_start = datetime.now()
-            
-            try:
-                self.logger.info("Step çalıştırılıyor", step_index=i, step=step)
-                
-                # Step'i çalıştır
-                step_result = await self.executor.execute_step_tool(step, i)
-                step_result["duration"] = (datetime.now() - step_start).total_seconds()
+        abort = False
+
+        i = 0
+        while i < len(steps) and not abort:
+            group = parallel_start.get(i)
+            if group:
+                self.logger.info("Paralel step grubu çalıştırılıyor", step_indices=group)
+                group_results = await asyncio.gather(
+                    *(self._execute_timed_step(steps[j], j) for j in group)
+                )
+            else:
+                # Hot loop: step başına formatting maliyeti debug'a indirildi
+                self.logger.debug("Step çalıştırılıyor", step_index=i, step=steps[i])
+                group = [i]
+                group_results = [await self._execute_timed_step(steps[i], i)]
+
+            for j, step_result in zip(group, group_results):
                 total_duration += step_result["duration"]
-                
                 step_results.append(step_result)
-                
+
                 # Hata durumunda recovery
-                if step_result["status"] == "error":
-                    recovery_result = await self._handle_step_failure(step, step_result, planning_result, context)
-                    
-                    if recovery_result["status"] == "recovered":
+                if step_result["status"] == STATUS_ERROR:
+                    recovery_result = await self._handle_step_failure(steps[j], step_result, planning_result, context)
+
+                    if recovery_result["status"] == STATUS_RECOVERED:
                         # Recovery başarılı, devam et
                         step_result.update(recovery_result)
-                    elif recovery_result["status"] == "abort":
+                    elif recovery_result["status"] == STATUS_ABORT:
                         # Test'i durdur
-                        self.logger.warning("Test aborting due to critical failure", step_index=i)
-                        break
-                
-            except Exception as e:
-                self.logger.error("Step execution exception", step_index=i, error=str(e))
-                step_results.append({
-                    "status": "error",
-                    "step_index": i,
-                    "error": str(e),
-                    "duration": (datetime.now() - step_start).total_seconds()
-                })
-        
+                        self.logger.warning("Test aborting due to critical failure", step_index=j)
+                        abort = True
+
+                # Kategorizasyon recovery sonrası yapılır (status değişmiş olabilir)
+                result_index = len(step_results) - 1
+                action = step_result.get("action", "")
+                actions.append(action)
+                statuses.append(step_result["status"])
+                # Prefix testi burada bir kez yapılır; verifier aynı soruyu
+                # step başına tekrar sormak yerine bu flag'i okur
+                is_assertion = action.startswith("assert")
+                step_result["is_assertion"] = is_assertion
+                if is_assertion:
+                    assertion_indices.append(result_index)
+                if step_result["status"] == STATUS_ERROR:
+                    failed_indices.append(result_index)
+
+                # Step sonucunu listeyi beklemeden dışarı akıt
+                if on_step:
+                    on_step(step_result)
+
+                if abort:
+                    break
+
+            i = group[-1] + 1
+
         # Browser'ı kapat
         await self.executor.close_browser_tool()
         
         return {
             "status": "completed",
             "steps": step_results,
+            "actions": actions,
+            "statuses": statuses,
+            "assertion_indices": assertion_indices,
+            "failed_indices": failed_indices,
             "total_duration": total_duration,
             "browser_config": browser_config
         }
     
+    async def _execute_timed_step(self, step: Dict[str, Any], step_index: int) -> Dict[str, Any]:
+        """Tek bir step'i çalıştırır ve süresini ölçer"""
+        # Monotonik sayaç: datetime.now() gibi tz'li obje + timedelta
+        # üretmeden step başına iki int okuması yeter
+        step_start_ns = time.perf_counter_ns()
+
+        try:
+            step_result = await self.executor.execute_step_tool(step, step_index)
+        except Exception as e:
+            self.logger.error("Step execution exception", step_index=step_index, error=str(e))
+            step_result = {
+                "status": "error",
+                "step_index": step_index,
+                "error": str(e)
+            }
+
+        step_result["duration"] = (time.perf_counter_ns() - step_start_ns) / 1e9
+        return step_result
+
     async def _run_verification_phase(self,
                                     scenario_data: Dict[str, Any],
                                     execution_result: Dict[str, Any], 
@@ -190,23 +431,33 @@ class CrewManager:
         """Verification fazını çalıştırır"""
         
         try:
-            # Test sonuçlarını doğrula
-            verification_result = self.verifier.verify_test_results_tool(execution_result)
-            
-            # Assertion'ları ayrıca kontrol et
-            assertion_steps = [s for s in execution_result["steps"] if s.get("action", "").startswith("assert")]
+            # Execution fazının tek geçişte çıkardığı indekslerden oku
+            step_results = execution_result["steps"]
+            assertion_steps = [step_results[i] for i in execution_result["assertion_indices"]]
+            failed_steps = [step_results[i] for i in execution_result["failed_indices"]]
+
+            # Üç verifier çağrısı da tamamlanmış execution_result üzerinde
+            # bağımsız çalışıyor: thread'lere atıp paralel bekle
+            verify_task = asyncio.to_thread(self.verifier.verify_test_results_tool, execution_result)
+            tasks = [verify_task]
             if assertion_steps:
-                assertion_validation = self.verifier.validate_assertions_tool(assertion_steps)
-                verification_result["assertion_validation"] = assertion_validation
-            
-            # Failure analizi
-            failed_steps = [s for s in execution_result["steps"] if s.get("status") == "error"]
+                tasks.append(asyncio.to_thread(self.verifier.validate_assertions_tool, assertion_steps))
             if failed_steps:
-                failure_analysis = self.verifier.analyze_failures_tool(failed_steps)
-                verification_result["failure_analysis"] = failure_analysis
-            
+                tasks.append(asyncio.to_thread(self.verifier.analyze_failures_tool, failed_steps))
+
+            results = await asyncio.gather(*tasks)
+            verification_result = results[0]
+
+            cursor = 1
+            if assertion_steps:
+                verification_result["assertion_validation"] = results[cursor]
+                cursor += 1
+            if failed_steps:
+                verification_result["failure_analysis"] = results[cursor]
+
             # Test raporu oluştur
-            test_report = self.verifier.generate_test_report_tool(
+            test_report = await asyncio.to_thread(
+                self.verifier.generate_test_report_tool,
                 scenario_data, execution_result, verification_result
             )
             
@@ -239,26 +490,49 @@ class CrewManager:
             "error_message": step_result.get("error")
         }
         
-        recovery_plan = self.planner.suggest_recovery_plan_tool(error_context)
+        recovery_plan = await asyncio.to_thread(self.planner.suggest_recovery_plan_tool, error_context)
         
         # Recovery strategy'ye göre aksiyon al
         strategy = recovery_plan.get("strategy", "skip")
         
         if strategy == "retry_with_fallback":
-            # Basit retry dene
+            # Backoff parametreleri planner tarafından error tipine göre ayarlanabilir
+            base = recovery_plan.get("backoff_base", 0.5)
+            cap = recovery_plan.get("backoff_cap", 8.0)
+            jitter = recovery_plan.get("backoff_jitter", 0.25)
+            retry_timeout = recovery_plan.get("retry_timeout", 30)
+
             for attempt in range(recovery_plan.get("max_attempts", 2)):
+                if attempt:
+                    # Exponential backoff + jitter: transient hataları
+                    # back-to-back retry fırtınasına çevirme
+                    delay = min(cap, base * 2 ** (attempt - 1))
+                    await asyncio.sleep(delay + random.uniform(0, jitter))
+
                 self.logger.info("Recovery attempt", attempt=attempt + 1)
-                
-                retry_result = await self.executor.execute_step_tool(failed_step, step_result["step_index"])
-                
-                if retry_result["status"] == "success":
+
+                try:
+                    retry_result = await asyncio.wait_for(
+                        self.executor.execute_step_tool(failed_step, step_result["step_index"]),
+                        timeout=retry_timeout
+                    )
+                except asyncio.TimeoutError:
+                    self.logger.warning("Recovery attempt timed out",
+                                      attempt=attempt + 1,
+                                      timeout=retry_timeout)
+                    continue
+
+                if retry_result["status"] == STATUS_SUCCESS:
                     return {
                         "status": "recovered",
                         "recovery_method": "retry",
+                        # Verifier retry sayımını bu flag'den okur; error
+                        # string'inde substring aramasına gerek kalmaz
+                        "retried": True,
                         "attempts": attempt + 1
                     }
             
-            return {"status": "abort", "reason": "Max retry attempts exceeded"}
+            return {"status": "abort", "retried": True, "reason": "Max retry attempts exceeded"}
         
         elif strategy == "skip":
             return {
@@ -271,17 +545,34 @@ class CrewManager:
             return {"status": "abort", "reason": "No recovery strategy available"}
     
     def _load_scenario(self, scenario_path: str) -> Optional[Dict[str, Any]]:
-        """YAML scenario dosyasını yükler"""
+        """YAML scenario dosyasını yükler (mtime-keyed cache üzerinden)"""
         try:
             scenario_file = Path(scenario_path)
             if not scenario_file.exists():
                 self.logger.error("Scenario dosyası bulunamadı", path=scenario_path)
                 return None
-            
-            with open(scenario_file, 'r', encoding='utf-8') as f:
-                scenario_data = yaml.safe_load(f)
-            
-            self.logger.info("Scenario yüklendi", path=scenario_path, steps=len(scenario_data.get("steps", [])))
+
+            # Cache anahtarı dosya içeriğini temsil eder; mtime/size
+            # değişince doğal invalidation olur. Cache'teki ağaç paylaşıldığı
+            # için çağırana deepcopy verilir.
+            st = scenario_file.stat()
+            scenario_data = _load_scenario_cached(
+                str(scenario_file.resolve()), st.st_mtime_ns, st.st_size
+            )
+            scenario_data = copy.deepcopy(scenario_data)
+
+            # Devre dışı / ortam dışı step'ler tek seferde burada elenir
+            kept, dropped_disabled, dropped_env = _normalize_steps(
+                scenario_data.get("steps", []),
+                env=os.environ.get("WEB_EVAL_ENV")
+            )
+            scenario_data["steps"] = kept
+
+            self.logger.info("Scenario yüklendi",
+                           path=scenario_path,
+                           steps=len(kept),
+                           dropped_disabled=dropped_disabled,
+                           dropped_env=dropped_env)
             return scenario_data
             
         except Exception as e:
@@ -292,24 +583,33 @@ class CrewManager:
                          scenario_data: Dict[str, Any],
                          execution_result: Dict[str, Any],
                          verification_result: Dict[str, Any], 
-                         context: Dict[str, Any]) -> Dict[str, Any]:
+                         context: Dict[str, Any]) -> "ScenarioResult":
         """Final sonuçları derler"""
         
-        end_time = datetime.now()
         start_time = context["start_time"]
-        total_duration = (end_time - start_time).total_seconds()
-        
-        return {
-            "metadata": {
+        total_duration = (time.perf_counter_ns() - context["start_perf_ns"]) / 1e9
+        # Wall-clock end_time, cache'lenmiş start + monotonik offset'ten türetilir
+        end_time = start_time + timedelta(seconds=total_duration)
+
+        return ScenarioResult(
+            metadata={
                 "scenario_name": scenario_data.get("name", "Unnamed Scenario"),
                 "scenario_path": context["scenario_path"],
                 "start_time": start_time.isoformat(),
                 "end_time": end_time.isoformat(),
                 "duration": total_duration
             },
-            "summary": verification_result["report"]["summary"],
-            "execution": execution_result,
-            "verification": verification_result["verification"],
-            "report": verification_result["report"],
-            "context": context
-        } 
\ No newline at end of file
+            summary=verification_result["report"]["summary"],
+            execution=execution_result,
+            verification=verification_result["verification"],
+            report=verification_result["report"],
+            # context bir scratch accumulator: scenario_data, analiz ve plan
+            # ağaçlarını da taşıyor. Rapora sadece JSON-scalar alanlar girer;
+            # böylece sonucu serialize/deepcopy eden çağıranlar tüm senaryo
+            # ağacını kopyalamak zorunda kalmaz
+            context={
+                "scenario_path": context["scenario_path"],
+                "start_time": start_time.isoformat(),
+                "status": context.get("status", "completed")
+            }
+        ) 
\ No newline at end of file
@@ -6,15 +6,216 @@ Test adımlarını Playwright ile yürütür.
 from typing import Dict, Any, Optional
 import structlog
 import asyncio
+import functools
+import hashlib
+import re
+import time
+import secrets
 from pathlib import Path
-import os
-from datetime import datetime
 
 # Playwright imports
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeoutError
 
 logger = structlog.get_logger(__name__)
 
+# Tüm context'ler için ortak varsayılanlar
+_DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+_DEFAULT_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                       "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+# Hata sınıflandırma: 5 ayrı substring araması yerine tek derlenmiş
+# alternation; eşleşen grup adı sınıfın kendisi
+_ERR_RE = re.compile(
+    r"(?P<timeout>timeout)"
+    r"|(?P<element_not_found>not found|element)"
+    r"|(?P<navigation_failed>navigation|load)"
+    r"|(?P<network_error>network)"
+    r"|(?P<assertion_failed>assertion)",
+    re.IGNORECASE
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_error_message(error_message: str) -> str:
+    """Hata mesajını tipe çevirir; aynı mesaj retry'larda tekrarlanır,
+    sonuç memoize edilir"""
+    match = _ERR_RE.search(error_message)
+    return match.lastgroup if match else "unknown"
+
+# Asset engelleme açıkken URL'si bu parçaları içeren istekler de kesilir:
+# analytics/tracking script'leri DOM doğrulamasına katkısız ama navigation
+# kuyruğunun en uzun kalemlerindendir
+_BLOCKED_HOST_FRAGMENTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "connect.facebook.net",
+    "hotjar.com",
+)
+
+# Docker/CI için bilinen perf/stabilite flag seti: /dev/shm tükenmesini,
+# zygote/GPU subprocess'lerini ve gereksiz arkaplan işlerini keser
+DEFAULT_CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-zygote",
+    "--disable-accelerated-2d-canvas",
+    "--no-first-run",
+    "--disable-background-networking",
+    "--disable-extensions",
+]
+
+# Tek DOM taramasında hem form elemanı metadata'sı hem login-buton adayları
+# toplanır; iki ayrı script'in aynı sayfayı ikişer kez gezmesini önler
+_SCAN_PAGE_INTERACTIVE_JS = """
+() => {
+    const all = document.querySelectorAll('input,button,select,a,[onclick],.btn');
+    const n = all.length;
+    const formElements = [];
+    const loginCandidates = [];
+    let highConfidence = false;
+
+    // outerHTML tüm subtree'yi serialize eder; form elemanları için
+    // elimizdeki attribute'lardan minimal bir açılış tag'i kurmak yeterli
+    const describe = (tagName, id, name, className, typeAttr) => {
+        let s = '<' + tagName;
+        if (id) s += ' id="' + id + '"';
+        if (name) s += ' name="' + name + '"';
+        if (typeAttr) s += ' type="' + typeAttr + '"';
+        if (className) s += ' class="' + className + '"';
+        return s + '>';
+    };
+
+    let inputIdx = 0, buttonIdx = 0, selectIdx = 0;
+
+    for (let i = 0; i < n; i++) {
+        const el = all[i];
+
+        // Görünmeyen elementler tıklanamaz/doldurulamaz; checkVisibility
+        // tarayıcı tarafından batch'lenir ve offsetParent/getBoundingClientRect
+        // gibi her element için layout zorlamaz
+        if (el.checkVisibility &&
+            !el.checkVisibility({ checkOpacity: true, checkVisibilityCSS: true })) {
+            continue;
+        }
+
+        const tag = el.tagName;
+        const id = el.id || '';
+        const className = (typeof el.className === 'string' ? el.className : '') || '';
+        const typeAttr = el.type || '';
+
+        // Kararlı, tekil selector: id/class'tan selector kurmak hem belirsiz
+        // (aynı class'ı paylaşan elementler) hem de O(N) selector taraması
+        // demek; data attribute ile O(1) tekil eşleşme garanti
+        el.setAttribute('data-wev-idx', String(i));
+        const selector = '[data-wev-idx="' + i + '"]';
+
+        if (tag === 'INPUT') {
+            formElements.push({
+                type: 'input',
+                selector: selector,
+                index: inputIdx++,
+                id: id || 'no-id',
+                name: el.name || 'no-name',
+                placeholder: el.placeholder || 'no-placeholder',
+                value: el.value || 'no-value',
+                type_attr: typeAttr || 'no-type',
+                className: className || 'no-class',
+                ariaLabel: el.getAttribute('aria-label') || 'no-aria-label',
+                outerHTML: describe('input', id, el.name, className, typeAttr)
+            });
+        } else if (tag === 'BUTTON') {
+            formElements.push({
+                type: 'button',
+                selector: selector,
+                index: buttonIdx++,
+                id: id || 'no-id',
+                text: el.textContent.trim() || 'no-text',
+                className: className || 'no-class',
+                ariaLabel: el.getAttribute('aria-label') || 'no-aria-label',
+                outerHTML: describe('button', id, '', className, typeAttr)
+            });
+        } else if (tag === 'SELECT') {
+            formElements.push({
+                type: 'select',
+                selector: selector,
+                index: selectIdx++,
+                id: id || 'no-id',
+                name: el.name || 'no-name',
+                className: className || 'no-class',
+                ariaLabel: el.getAttribute('aria-label') || 'no-aria-label',
+                outerHTML: describe('select', id, el.name, className, '')
+            });
+        }
+
+        // Login adayı skorlama (yüksek güvenli eşleşme bulunduysa atlanır)
+        if (!highConfidence) {
+            const clickable = tag === 'BUTTON' || tag === 'A' ||
+                (tag === 'INPUT' && (typeAttr === 'submit' || typeAttr === 'button')) ||
+                el.hasAttribute('onclick') ||
+                className.toLowerCase().indexOf('btn') !== -1;
+
+            if (clickable) {
+                const text = (el.textContent || '').trim();
+                const onClick = el.getAttribute('onclick') || '';
+                const tLow = text.toLowerCase();
+
+                // exact text = 100, keyword text = 50, attribute ipuçları = 20
+                let score = 0;
+                if (tLow === 'giriş yap' || tLow === 'login' || tLow === 'oturum aç') {
+                    score = 100;
+                } else {
+                    if (tLow.indexOf('giriş') !== -1 ||
+                        tLow.indexOf('login') !== -1 ||
+                        tLow.indexOf('oturum') !== -1) score += 50;
+                    if (onClick.toLowerCase().indexOf('login') !== -1) score += 20;
+                    if (className.toLowerCase().indexOf('login') !== -1) score += 20;
+                    if (id.toLowerCase().indexOf('login') !== -1) score += 20;
+                    if (score === 0 && text.indexOf('Gir') !== -1) score += 10;
+                }
+
+                if (score > 0) {
+                    const candidate = {
+                        index: i,
+                        selector: selector,
+                        score: score,
+                        tagName: tag.toLowerCase(),
+                        id: id,
+                        className: className,
+                        text: text,
+                        onclick: onClick,
+                        type: typeAttr || 'no-type',
+                        href: el.href || 'no-href',
+                        outerHTML: el.outerHTML.substring(0, 300)
+                    };
+
+                    if (score >= 100) {
+                        highConfidence = true;
+                        loginCandidates.length = 0;
+                    }
+                    loginCandidates.push(candidate);
+                }
+            }
+        }
+    }
+
+    // Sıralama ve kırpma sayfa içinde yapılır: CDP üzerinden yalnızca
+    // en iyi adaylar taşınır, Python tarafında ikinci bir geçiş gerekmez
+    loginCandidates.sort((a, b) => b.score - a.score);
+
+    return {
+        ready: true,
+        readyState: document.readyState,
+        interactiveCount: n,
+        formElements: formElements,
+        loginCandidates: loginCandidates.slice(0, 15),
+        highConfidence: highConfidence
+    };
+}
+"""
+
 
 class ExecutorAgent:
     """
@@ -35,54 +236,222 @@ class ExecutorAgent:
         self.browser = None
         self.context = None
         self.page = None
-    
-    async def initialize_browser_tool(self, browser_config: Dict[str, Any]) -> Dict[str, str]:
+
+        # Paylaşılan browser kullanılıyorsa cleanup'ta browser'a dokunulmaz
+        self._owns_browser = True
+
+        # prewarm() ile başlatılmış browser cleanup'tan sağ çıkar;
+        # shutdown() çağrılana kadar sıcak kalır
+        self._keep_warm = False
+
+        # Başarılı init sonrası True: step/tool çağrıları browser durumunu
+        # yeniden problamak yerine bu flag'e güvenir
+        self._initialized = False
+
+        # Sayfaya inject edilmiş script'lerin takibi (navigation'da sıfırlanır)
+        self._injected_scripts: set = set()
+
+        # Sayfa taraması memoizasyonu: aynı DOM durumu için scan sonucu
+        # tekrar kullanılır (ucuz fingerprint ile doğrulanır)
+        self._last_dom_fp: Optional[str] = None
+        self._last_scan: Optional[Dict[str, Any]] = None
+
+        # Arka planda süren screenshot disk yazmaları (cleanup'ta beklenir)
+        self._pending_writes: set = set()
+
+        # Screenshot dedup: sayfa değişmediyse aynı kareyi tekrar diske
+        # yazmak gereksiz; son karenin hash'i ile karşılaştırılır
+        self._last_shot_hash: Optional[str] = None
+        self._last_shot_path: Optional[str] = None
+
+        # Screenshot dizini bir kez kurulur; her çağrıda Path kurma ve
+        # var-olma kontrolü yapılmaz
+        # Verifier'ın artifact taraması ve Config ile aynı dizin; handle
+        # bir kez kurulur, her screenshot'ta Path inşa edilmez
+        self._screenshot_dir = Path("screenshots")
+        self._screenshot_dir.mkdir(parents=True, exist_ok=True)
+
+        # Playwright, context kapanana kadar Request/Response objelerini
+        # biriktirir; uzun koşularda RSS'i sınırlamak için context her
+        # _max_context_uses step'te bir yenilenir (storage state korunur)
+        self._steps_since_recycle = 0
+        self._max_context_uses = 50
+        # Paralel step grupları aynı executor'ı eşzamanlı çağırır; recycle
+        # tek seferde ve tek task tarafından yapılmalı
+        self._recycle_lock = asyncio.Lock()
+        self._default_timeout = 30000
+        self._block_assets = False
+
+        # Step dispatch tablosu: elif zincirindeki 9 membership testi
+        # yerine tek lookup. URL assertion varyantları partial ile ayrışır.
+        self._dispatch = {
+            "goto": self._execute_goto,
+            "fill": self._execute_fill,
+            "click": self._execute_click,
+            "click_and_wait_url": self._execute_click_and_wait,
+            "select": self._execute_select,
+            "assert_url_not_contains": functools.partial(self._execute_url_assertion, should_contain=False),
+            "assert_url_contains": functools.partial(self._execute_url_assertion, should_contain=True),
+            "wait": self._execute_wait,
+            "screenshot": self._execute_screenshot,
+            "expect_download": self._execute_expect_download,
+        }
+
+        # Site-özel fill sonrası düzeltmeler: selector -> hook. Yeni
+        # fixup'lar hot path'e branch eklemeden buraya kaydedilir.
+        self._post_fill_hooks = {
+            "#search_tb": self._trigger_search_refresh,
+        }
+
+    async def _launch_browser(self, browser_config: Dict[str, Any]) -> None:
+        """Playwright'ı başlatır ve konfigüre edilen browser'ı launch eder"""
+        self.playwright = await async_playwright().start()
+
+        browser_type = browser_config.get("browser", "chromium")
+        if browser_type == "firefox":
+            self.browser = await self.playwright.firefox.launch(headless=self.headless)
+        elif browser_type == "webkit":
+            self.browser = await self.playwright.webkit.launch(headless=self.headless)
+        else:  # chromium (default)
+            self.browser = await self.playwright.chromium.launch(
+                headless=self.headless,
+                args=browser_config.get("chromium_args", DEFAULT_CHROMIUM_ARGS)
+            )
+
+    async def prewarm(self, browser_config: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """
+        Browser'ı context/page açmadan önceden başlatır
+
+        Uygulama startup'ında (örn. lifespan hook) çağrılır; sonraki
+        initialize_browser_tool çağrıları cold-start yerine sadece yeni
+        context+page açar. Sıcak browser shutdown() ile kapatılır.
+        """
+        if self.browser:
+            return {"status": "success", "message": "Browser zaten sıcak"}
+
+        try:
+            self._owns_browser = True
+            self._keep_warm = True
+            await self._launch_browser(browser_config or {})
+            self.logger.info("Browser prewarm tamamlandı")
+            return {"status": "success", "message": "Browser önceden başlatıldı"}
+        except Exception as e:
+            self._keep_warm = False
+            self.logger.error("Browser prewarm hatası", error=str(e))
+            return {"status": "error", "message": f"Browser başlatılamadı: {str(e)}"}
+
+    async def shutdown(self) -> None:
+        """Sıcak tutulan browser dahil tüm kaynakları kapatır"""
+        self._keep_warm = False
+        await self._cleanup_browser()
+
+    async def initialize_browser_tool(self, browser_config: Dict[str, Any], browser: Optional[Browser] = None) -> Dict[str, str]:
         """
         Browser session'ını başlatır
-        
+
         Args:
             browser_config: Browser ayarları
-            
+            browser: Paylaşılan Browser instance'ı (varsa yeni launch yapılmaz,
+                     sadece yeni context/page açılır)
+
         Returns:
             Initialization durumu
         """
         try:
-            self.logger.info("Playwright browser başlatılıyor", 
+            self.logger.info("Playwright browser başlatılıyor",
                            headless=self.headless,
-                           browser_type=browser_config.get("browser", "chromium"))
-            
-            # Playwright'ı başlat
-            self.playwright = await async_playwright().start()
-            
-            # Browser tipini belirle
-            browser_type = browser_config.get("browser", "chromium")
-            if browser_type == "firefox":
-                self.browser = await self.playwright.firefox.launch(headless=self.headless)
-            elif browser_type == "webkit":
-                self.browser = await self.playwright.webkit.launch(headless=self.headless)
-            else:  # chromium (default)
-                self.browser = await self.playwright.chromium.launch(headless=self.headless)
-            
-            # Context oluştur
-            self.context = await self.browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            )
-            
-            # Page oluştur
-            self.page = await self.context.new_page()
+                           browser_type=browser_config.get("browser", "chromium"),
+                           shared_browser=browser is not None)
+
+            cdp_url = browser_config.get("cdp_url")
+            persistent = browser_config.get("persistent", False)
+
+            if persistent:
+                # Kalıcı profil: cookie, HTTP cache ve service worker'lar
+                # koşular arasında korunur — tekrar login ve asset indirme
+                # maliyeti düşer. Browser objesi yoktur, context doğrudan
+                # launch edilir.
+                self._owns_browser = True
+                self.playwright = await async_playwright().start()
+                self.context = await self.playwright.chromium.launch_persistent_context(
+                    browser_config.get("user_data_dir", str(Path.home() / ".web-eval" / "profile")),
+                    headless=self.headless,
+                    viewport=_DEFAULT_VIEWPORT,
+                    user_agent=_DEFAULT_USER_AGENT,
+                    args=browser_config.get("chromium_args", DEFAULT_CHROMIUM_ARGS)
+                )
+                self.browser = None
+            elif browser is not None:
+                # Paylaşılan browser: process launch maliyeti yok, context-per-scenario
+                self.browser = browser
+                self._owns_browser = False
+            elif cdp_url:
+                # Host'ta çalışan tek Chromium'a CDP üzerinden bağlan:
+                # agent başına launch yerine paylaşılan process, her agent
+                # yine kendi context'ini açar. Cleanup'ta sadece bağlantı
+                # kesilir, uzaktaki browser yaşamaya devam eder.
+                self._owns_browser = False
+                self.playwright = await async_playwright().start()
+                self.browser = await self.playwright.chromium.connect_over_cdp(cdp_url)
+            elif self.browser is not None:
+                # prewarm() ile başlatılmış sıcak browser: launch atlanır,
+                # sadece yeni context+page açılır
+                pass
+            else:
+                self._owns_browser = True
+                await self._launch_browser(browser_config)
+
+            # Context oluştur (persistent modda launch sırasında açıldı)
+            if self.context is None:
+                self.context = await self.browser.new_context(
+                    viewport=_DEFAULT_VIEWPORT,
+                    user_agent=_DEFAULT_USER_AGENT
+                )
             
+            # Tarama fonksiyonunu context init script'i olarak kur: kaynak
+            # CDP'den bir kez gider, her navigation'da tarayıcı kendisi
+            # tanımlar; evaluate çağrıları ~30 byte'lık isimle yapılır
+            await self.context.add_init_script(
+                f"window.__scanPageInteractive = {_SCAN_PAGE_INTERACTIVE_JS};"
+            )
+
+            # Asset engelleme (opsiyonel): sadece DOM/URL doğrulayan
+            # testlerde görsel/font/medya indirmeleri bant genişliği ve
+            # CPU israfıdır. Context seviyesinde tek handler kaydedilir;
+            # route birikimi context recycle ile sınırlı kalır.
+            self._block_assets = browser_config.get("block_assets", False)
+            if self._block_assets:
+                await self._apply_asset_blocking(self.context)
+
+            # Page oluştur (persistent context ilk page ile gelir)
+            if self.context.pages:
+                self.page = self.context.pages[0]
+            else:
+                self.page = await self.context.new_page()
+
+            # Navigation sonrası inject edilmiş script'ler kaybolur, cache'i temizle
+            self._injected_scripts.clear()
+            self.page.on("framenavigated", lambda frame: self._reset_page_caches())
+
             # Timeout ayarları
             timeout = browser_config.get("timeout", 30000)
+            self._default_timeout = timeout
             self.page.set_default_timeout(timeout)
             self.page.set_default_navigation_timeout(timeout)
-            
+
+            self._max_context_uses = browser_config.get("max_context_uses", 50)
+            self._steps_since_recycle = 0
+
+            self._initialized = True
+
             self.logger.info("Playwright browser başarıyla başlatıldı")
             
             return {
                 "status": "success",
                 "message": "Browser başarıyla başlatıldı",
-                "session_id": f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                # strftime yerine token_hex: hem daha ucuz hem saniye içi
+                # çakışma riski yok
+                "session_id": f"session_{secrets.token_hex(8)}"
             }
             
         except Exception as e:
@@ -93,20 +462,27 @@ class ExecutorAgent:
                 "message": f"Browser başlatılamadı: {str(e)}"
             }
     
-    async def execute_step_tool(self, step_data: Dict[str, Any], step_index: int) -> Dict[str, Any]:
+    async def execute_step_tool(self,
+                                step_data: Dict[str, Any],
+                                step_index: int,
+                                page: Optional[Page] = None) -> Dict[str, Any]:
         """
         Tek bir test step'ini çalıştırır
         
         Args:
             step_data: Step verileri 
             step_index: Step sırası
+            page: Kullanılacak page (havuzdan alınmışsa); verilmezse
+                  executor'ın varsayılan page'i kullanılır
             
         Returns:
             Execution sonucu
         """
-        self.logger.info("Step çalıştırılıyor", step_index=step_index, step_data=step_data)
+        # step_data dict'ini INFO'da serialize etme; tamamlanma satırı
+        # step başına tek özet log olarak kalır
+        self.logger.debug("Step çalıştırılıyor", step_index=step_index, step_data=step_data)
         
-        if not self.page:
+        if not self._initialized:
             return {
                 "status": "error",
                 "step_index": step_index,
@@ -114,41 +490,33 @@ class ExecutorAgent:
             }
         
         try:
-            result = {"status": "success", "step_index": step_index, "duration": 0.0}
-            start_time = datetime.now()
-            
-            # Her step türü için implementation
-            if "goto" in step_data:
-                result.update(await self._execute_goto(step_data["goto"]))
-                
-            elif "fill" in step_data:
-                result.update(await self._execute_fill(step_data["fill"]))
-                
-            elif "click" in step_data:
-                result.update(await self._execute_click(step_data["click"]))
-                
-            elif "select" in step_data:
-                result.update(await self._execute_select(step_data["select"]))
-                
-            elif "assert_url_not_contains" in step_data:
-                result.update(await self._execute_url_assertion(step_data["assert_url_not_contains"], False))
-                
-            elif "assert_url_contains" in step_data:
-                result.update(await self._execute_url_assertion(step_data["assert_url_contains"], True))
-                
-            elif "wait" in step_data:
-                result.update(await self._execute_wait(step_data["wait"]))
-                
-            elif "screenshot" in step_data:
-                result.update(await self._execute_screenshot(step_data["screenshot"]))
-                
-            elif "expect_download" in step_data:
-                result.update(await self._execute_expect_download(step_data["expect_download"]))
-                
-            else:
+            # Varsayılan context kullanılıyorsa periyodik olarak yenile
+            if page is None:
+                self._steps_since_recycle += 1
+                if self._steps_since_recycle > self._max_context_uses:
+                    async with self._recycle_lock:
+                        # Lock beklerken paralel bir grup üyesi recycle'ı
+                        # yapmış olabilir; eşiği tekrar kontrol et
+                        if self._steps_since_recycle > self._max_context_uses:
+                            await self._recycle_context()
+
+            # Monotonik sayaç: wall-clock objesi + timedelta aritmetiği yerine
+            # iki float okuması
+            start_time = time.perf_counter()
+            page = page or self.page
+            
+            # Step türünü dispatch tablosundan bul ve çalıştır
+            action = next((k for k in step_data if k in self._dispatch), None)
+            if action is None:
                 raise ValueError(f"Desteklenmeyen step türü: {step_data}")
+
+            # Helper'ın döndürdüğü dict sonucun kendisi olur: ayrı base dict
+            # + update (rehash) yerine step başına tek dict yaşar
+            result = await self._dispatch[action](step_data[action], page=page)
+            result.setdefault("status", "success")
+            result["step_index"] = step_index
             
-            result["duration"] = (datetime.now() - start_time).total_seconds()
+            result["duration"] = time.perf_counter() - start_time
             self.logger.info("Step başarıyla tamamlandı", step_index=step_index, duration=result["duration"])
             return result
             
@@ -164,30 +532,130 @@ class ExecutorAgent:
                 "error_type": self._classify_error(str(e))
             }
     
-    async def take_screenshot_tool(self, filename: Optional[str] = None) -> Dict[str, str]:
+    @staticmethod
+    async def _apply_asset_blocking(context: BrowserContext) -> None:
+        """Görsel/font/medya/stylesheet ve analytics isteklerini engeller"""
+        blocked_types = {"image", "font", "media", "stylesheet"}
+
+        async def _router(route):
+            request = route.request
+            if (request.resource_type in blocked_types
+                    or any(host in request.url for host in _BLOCKED_HOST_FRAGMENTS)):
+                await route.abort()
+            else:
+                await route.continue_()
+
+        await context.route("**/*", _router)
+
+    async def _recycle_context(self) -> None:
+        """
+        Varsayılan context'i storage state'i koruyarak yeniden açar
+
+        Sadece context.close() Playwright connection'ında biriken
+        Request/Response ChannelOwner'larını serbest bırakır; cookie ve
+        localStorage yeni context'e taşınır.
+        """
+        if self.browser is None:
+            # Persistent context'in üst Browser objesi yok; profil zaten
+            # diskte yaşadığı için recycle gereksizdir
+            self._steps_since_recycle = 0
+            return
+
+        self.logger.info("Browser context yenileniyor",
+                       steps_since_recycle=self._steps_since_recycle)
+
+        # Storage state sayfayı geri getirmez: mevcut URL saklanır ve
+        # yeni page açıldıktan sonra oraya dönülür
+        current_url = self.page.url if self.page else None
+        state = await self.context.storage_state()
+        await self.context.close()
+
+        self.context = await self.browser.new_context(
+            viewport=_DEFAULT_VIEWPORT,
+            user_agent=_DEFAULT_USER_AGENT,
+            storage_state=state
+        )
+        await self.context.add_init_script(
+            f"window.__scanPageInteractive = {_SCAN_PAGE_INTERACTIVE_JS};"
+        )
+        if self._block_assets:
+            await self._apply_asset_blocking(self.context)
+        self.page = await self.context.new_page()
+
+        self._injected_scripts.clear()
+        self.page.on("framenavigated", lambda frame: self._reset_page_caches())
+        self.page.set_default_timeout(self._default_timeout)
+        self.page.set_default_navigation_timeout(self._default_timeout)
+
+        if current_url and current_url != "about:blank":
+            await self.page.goto(current_url, wait_until="domcontentloaded")
+
+        self._steps_since_recycle = 0
+
+    def _flush_screenshot_async(self, path: Path, data: bytes) -> None:
+        """
+        Screenshot byte'larını arka planda diske yazar
+
+        PNG encode CDP tarafında bitmiştir; dosya yazması thread'e atılır
+        ki bir sonraki step diski beklemeden başlayabilsin. Bekleyen
+        yazmalar _cleanup_browser'da toplanır.
+        """
+        task = asyncio.create_task(asyncio.to_thread(path.write_bytes, data))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def take_screenshot_tool(self, filename: Optional[str] = None, format: str = "jpeg") -> Dict[str, str]:
         """
         Mevcut sayfa ekran görüntüsünü alır
         
         Args:
             filename: Screenshot dosya adı (optional)
+            format: "jpeg" (varsayılan, encode + disk 5-10x daha ucuz)
+                    veya kayıpsız gereken durumlar için "png"
             
         Returns:
             Screenshot sonucu
         """
         try:
-            if not self.page:
+            if not self._initialized:
                 return {
                     "status": "error",
                     "message": "Browser page mevcut değil"
                 }
             
-            if not filename:
-                filename = f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
+            if filename:
+                # Verilen dosya adının uzantısı formatı belirler: .png'ye
+                # JPEG byte'ı yazılmaz
+                if filename.lower().endswith(".png"):
+                    format = "png"
+                elif filename.lower().endswith((".jpg", ".jpeg")):
+                    format = "jpeg"
+            else:
+                ext = "jpg" if format == "jpeg" else "png"
+                filename = f"screenshot_{int(time.time() * 1000)}_{secrets.token_hex(4)}.{ext}"
             
-            screenshot_path = Path("screenshots") / filename
+            screenshot_path = self._screenshot_dir / filename
             
-            # Gerçek screenshot al
-            await self.page.screenshot(path=str(screenshot_path))
+            # Byte'ları al, disk yazmasını arka plana bırak
+            data = await self.page.screenshot(
+                type=format,
+                quality=80 if format == "jpeg" else None
+            )
+
+            # Kare son yazılanla aynıysa diske dokunma
+            shot_hash = hashlib.sha256(data).hexdigest()
+            if shot_hash == self._last_shot_hash and self._last_shot_path:
+                self.logger.debug("Screenshot değişmedi, yazma atlandı",
+                                filename=filename)
+                return {
+                    "status": "unchanged",
+                    "path": self._last_shot_path,
+                    "filename": filename
+                }
+
+            self._flush_screenshot_async(screenshot_path, data)
+            self._last_shot_hash = shot_hash
+            self._last_shot_path = str(screenshot_path)
             
             self.logger.info("Screenshot alındı", filename=filename, path=str(screenshot_path))
             
@@ -225,30 +693,73 @@ class ExecutorAgent:
     async def _cleanup_browser(self):
         """Browser kaynaklarını temizle"""
         try:
+            # Bekleyen screenshot yazmalarını tamamla
+            if self._pending_writes:
+                await asyncio.gather(*self._pending_writes, return_exceptions=True)
+                self._pending_writes.clear()
+
             if self.context:
                 await self.context.close()
                 self.context = None
-            
+
             if self.browser:
-                await self.browser.close()
-                self.browser = None
-            
-            if self.playwright:
+                # Paylaşılan browser'ı kapatmak diğer scenarioları düşürür;
+                # prewarm edilmiş browser ise shutdown()'a kadar sıcak kalır
+                if self._owns_browser and not self._keep_warm:
+                    await self.browser.close()
+                if not self._keep_warm:
+                    self.browser = None
+
+            if self.playwright and not self._keep_warm:
                 await self.playwright.stop()
                 self.playwright = None
-            
+
             self.page = None
-            
+            self._initialized = False
+            self._injected_scripts.clear()
+
         except Exception as e:
             self.logger.warning("Browser cleanup hatası", error=str(e))
     
-    async def _execute_goto(self, url: str) -> Dict[str, Any]:
-        """URL'ye git action'ını çalıştırır"""
-        self.logger.info("URL'ye gidiliyor", url=url)
+    def _reset_page_caches(self) -> None:
+        """Navigation/DOM değişikliği sonrası sayfa-scoped cache'leri sıfırlar"""
+        self._injected_scripts.clear()
+        self._last_dom_fp = None
+        self._last_scan = None
+        self._last_shot_hash = None
+
+    async def _execute_goto(self, goto_data: Any, page: Optional[Page] = None) -> Dict[str, Any]:
+        """
+        URL'ye git action'ını çalıştırır
+
+        Varsayılan wait_until "domcontentloaded": assertion'ların çoğu
+        DOM'a bakar, tüm subresource'ları (reklam/analytics/görsel)
+        beklemek goto gecikmesinin en uzun kuyruğudur. Gerçekten "load"
+        veya "networkidle" gereken step'ler dict formuyla override eder:
+        goto: {url: ..., wait_until: load}
+
+        Dict formu ayrıca expected_selector alır: domcontentloaded sonrası
+        tam load'u beklemek yerine bir sonraki step'in hedef elementi
+        beklenir — navigation kuyruğu (tracking script'leri vs.) selector
+        beklemesiyle örtüşür.
+        """
+        if isinstance(goto_data, dict):
+            url = goto_data["url"]
+            wait_until = goto_data.get("wait_until", "domcontentloaded")
+            expected_selector = goto_data.get("expected_selector")
+        else:
+            url = goto_data
+            wait_until = "domcontentloaded"
+            expected_selector = None
+
+        self.logger.debug("URL'ye gidiliyor", url=url, wait_until=wait_until)
+        page = page or self.page
         
         try:
-            await self.page.goto(url, wait_until="load")
-            current_url = self.page.url
+            await page.goto(url, wait_until=wait_until)
+            if expected_selector:
+                await page.wait_for_selector(expected_selector)
+            current_url = page.url
             
             return {
                 "action": "goto",
@@ -258,111 +769,160 @@ class ExecutorAgent:
         except PlaywrightTimeoutError:
             raise TimeoutError(f"Sayfa yüklenirken timeout: {url}")
     
-    async def _execute_fill(self, fill_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_fill(self, fill_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
         """Form fill action'ını çalıştırır"""
-        self.logger.info("Form alanı doldruluyor", fill_data=fill_data)
+        self.logger.debug("Form alanı doldruluyor", fill_data=fill_data)
+        page = page or self.page
         
         value = fill_data["value"]
         
-        # Selector'ı belirle
+        # Locator'ı belirle: get_by_* API'leri label/aria-label ilişkisini
+        # Playwright tarafında çözer ve kullanıcı metnindeki tırnak/köşeli
+        # parantezler selector parser'ına sızmaz
         if "label" in fill_data:
-            # Label ile element bulma
-            selector = f"input[aria-label='{fill_data['label']}'], label:has-text('{fill_data['label']}') + input, label:has-text('{fill_data['label']}') input"
+            target = fill_data["label"]
+            locator = page.get_by_label(target).first
         elif "placeholder" in fill_data:
-            # Placeholder ile element bulma
-            selector = f"input[placeholder='{fill_data['placeholder']}']"
+            target = fill_data["placeholder"]
+            locator = page.get_by_placeholder(target).first
         elif "selector" in fill_data:
-            # Direkt selector
-            selector = fill_data["selector"]
+            target = fill_data["selector"]
+            locator = page.locator(target).first
         else:
             raise ValueError("Fill action için label, placeholder veya selector gerekli")
         
         try:
-            # Element'i bekle ve doldur
-            await self.page.wait_for_selector(selector, timeout=10000)
-            await self.page.fill(selector, value)
+            # fill kendi actionability beklemesini yapar; ayrı wait_for
+            # fazladan bir CDP turu olurdu
+            await locator.fill(value, timeout=10000)
+            self._last_dom_fp = None
             
-            # Dijidemi arama kutusu için özel tetikleme
-            if selector == "#search_tb":
-                self.logger.info("Dijidemi arama kutusu için JavaScript eventi tetikleniyor")
-                # Space ekle ve backspace bas (arama fonksiyonunu tetiklemek için)
-                await self.page.press(selector, " ")
-                await self.page.press(selector, "Backspace")
+            # Site-özel fill sonrası hook (varsa)
+            hook = self._post_fill_hooks.get(fill_data.get("selector"))
+            if hook:
+                await hook(locator)
             
             return {
                 "action": "fill",
-                "field": fill_data.get("label") or fill_data.get("placeholder") or fill_data.get("selector"),
+                "field": target,
                 "value": value
             }
         except PlaywrightTimeoutError:
-            raise TimeoutError(f"Form alanı bulunamadı: {selector}")
+            raise TimeoutError(f"Form alanı bulunamadı: {target}")
     
-    async def _execute_click(self, click_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Click action'ını çalıştırır"""
-        self.logger.info("Element'e tıklanıyor", click_data=click_data)
-        
-        # Selector'ı belirle
+    @staticmethod
+    def _resolve_click_locator(page: Page, click_data: Dict[str, Any]):
+        """Click verisinden (locator, hedef açıklaması) çifti üretir"""
         if "text" in click_data:
-            # Text ile element bulma
-            selector = f"text={click_data['text']}"
+            target = click_data["text"]
+            # exact verilmez: baseline text= engine'i gibi case-insensitive
+            # substring eşleşmesi korunur
+            locator = page.get_by_text(target).first
         elif "selector" in click_data:
-            # Direkt selector
-            selector = click_data["selector"]
+            target = click_data["selector"]
+            locator = page.locator(target).first
         elif "label" in click_data:
-            # Aria-label ile element bulma
-            selector = f"[aria-label='{click_data['label']}']"
+            target = click_data["label"]
+            locator = page.get_by_label(target).first
         else:
             raise ValueError("Click action için text, selector veya label gerekli")
+        return locator, target
+
+    async def _trigger_search_refresh(self, locator) -> None:
+        """Dijidemi arama kutusu: fill sonrası arama fonksiyonunu tetikler"""
+        self.logger.debug("Dijidemi arama kutusu için JavaScript eventi tetikleniyor")
+        # Space ekle ve backspace bas (arama fonksiyonunu tetiklemek için)
+        await locator.press(" ")
+        await locator.press("Backspace")
+
+    async def _execute_click(self, click_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
+        """Click action'ını çalıştırır"""
+        self.logger.debug("Element'e tıklanıyor", click_data=click_data)
+        page = page or self.page
+        
+        # Locator'ı belirle (metin değerleri parser'a string olarak gömülmez)
+        locator, target = self._resolve_click_locator(page, click_data)
         
         try:
-            # Element'i bekle ve tıkla
-            await self.page.wait_for_selector(selector, timeout=10000)
-            await self.page.click(selector)
+            # click kendi actionability beklemesini yapar
+            await locator.click(timeout=10000)
+            self._last_dom_fp = None
             
             return {
                 "action": "click",
-                "target": click_data.get("text") or click_data.get("selector") or click_data.get("label")
+                "target": target
             }
         except PlaywrightTimeoutError:
-            raise TimeoutError(f"Tıklanacak element bulunamadı: {selector}")
+            raise TimeoutError(f"Tıklanacak element bulunamadı: {target}")
     
-    async def _execute_select(self, select_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_click_and_wait(self, data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
+        """
+        Tıkla ve URL değişimini bekle (fused step)
+
+        click + wait:{for_url_contains} çiftinin iki ayrı CDP turunu tek
+        adımda birleştirir; navigation beklemesi tıklamadan önce kurulur,
+        aynı tick'te dönen navigation kaçmaz.
+        """
+        self.logger.debug("Click+URL bekleme çalıştırılıyor", data=data)
+        page = page or self.page
+
+        fragment = data.get("url_contains")
+        if not fragment:
+            raise ValueError("click_and_wait_url için url_contains gerekli")
+
+        locator, target = self._resolve_click_locator(page, data)
+
+        try:
+            async with page.expect_navigation(url=f"**/*{fragment}*", timeout=30000):
+                await locator.click()
+
+            return {
+                "action": "click_and_wait_url",
+                "target": target,
+                "url_contains": fragment,
+                "current_url": page.url
+            }
+        except PlaywrightTimeoutError:
+            raise TimeoutError(f"Click sonrası URL değişmedi: {fragment}")
+
+    async def _execute_select(self, select_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
         """Select/dropdown action'ını çalıştırır"""
-        self.logger.info("Dropdown seçimi yapılıyor", select_data=select_data)
+        self.logger.debug("Dropdown seçimi yapılıyor", select_data=select_data)
+        page = page or self.page
         
         option = select_data["option"]
         
-        # Selector'ı belirle
+        # Locator'ı belirle
         if "label" in select_data:
-            # Label ile select bulma
-            selector = f"select[aria-label='{select_data['label']}'], label:has-text('{select_data['label']}') + select, label:has-text('{select_data['label']}') select"
+            target = select_data["label"]
+            locator = page.get_by_label(target).first
         elif "selector" in select_data:
-            # Direkt selector
-            selector = select_data["selector"]
+            target = select_data["selector"]
+            locator = page.locator(target).first
         else:
             raise ValueError("Select action için label veya selector gerekli")
         
         try:
-            # Element'i bekle ve seç
-            await self.page.wait_for_selector(selector, timeout=10000)
-            await self.page.select_option(selector, label=option)
+            # select_option kendi actionability beklemesini yapar
+            await locator.select_option(label=option, timeout=10000)
             
             return {
                 "action": "select",
-                "field": select_data.get("label") or select_data.get("selector"),
+                "field": target,
                 "option": option
             }
         except PlaywrightTimeoutError:
-            raise TimeoutError(f"Dropdown bulunamadı: {selector}")
+            raise TimeoutError(f"Dropdown bulunamadı: {target}")
     
-    async def _execute_url_assertion(self, fragment: str, should_contain: bool) -> Dict[str, Any]:
+    async def _execute_url_assertion(self, fragment: str, should_contain: bool, page: Optional[Page] = None) -> Dict[str, Any]:
         """URL assertion'ını çalıştırır"""
-        self.logger.info("URL assertion kontrol ediliyor", 
-                        fragment=fragment, 
-                        should_contain=should_contain)
+        self.logger.debug("URL assertion kontrol ediliyor",
+                         fragment=fragment,
+                         should_contain=should_contain)
+        page = page or self.page
         
         # Current URL'yi al
-        current_url = self.page.url
+        current_url = page.url
         
         contains = fragment in current_url
         passed = contains if should_contain else not contains
@@ -379,21 +939,29 @@ class ExecutorAgent:
             "passed": passed
         }
     
-    async def _execute_wait(self, wait_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_wait(self, wait_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
         """Wait action'ını çalıştırır"""
-        self.logger.info("Bekleme yapılıyor", wait_data=wait_data)
+        self.logger.debug("Bekleme yapılıyor", wait_data=wait_data)
+        page = page or self.page
         
-        if wait_data.get("seconds"):
-            await asyncio.sleep(wait_data["seconds"])
+        seconds = wait_data.get("seconds")
+        if seconds and (wait_data.get("for_element") or wait_data.get("for_url_contains")):
+            # Birden fazla koşul: en erken sağlanan kazanır. Sabit sleep
+            # üst sınır görevi görür, koşul erken sağlanırsa kalan süre
+            # beklenmez.
+            return await self._race_wait_conditions(wait_data, seconds, page)
+
+        if seconds:
+            await asyncio.sleep(seconds)
             return {
                 "action": "wait",
-                "duration": wait_data["seconds"]
+                "duration": seconds
             }
         elif wait_data.get("for_element"):
             # Element'in görünmesini bekle
             selector = wait_data["for_element"]
             try:
-                await self.page.wait_for_selector(selector, timeout=30000)
+                await page.wait_for_selector(selector, timeout=30000)
                 return {
                     "action": "wait",
                     "for_element": selector
@@ -404,7 +972,7 @@ class ExecutorAgent:
             # URL değişikliği için bekle
             fragment = wait_data["for_url_contains"]
             try:
-                await self.page.wait_for_url(f"**/*{fragment}*", timeout=30000)
+                await page.wait_for_url(f"**/*{fragment}*", timeout=30000)
                 return {
                     "action": "wait",
                     "for_url_contains": fragment
@@ -416,28 +984,84 @@ class ExecutorAgent:
                 "action": "wait",
                 "duration": 0
             }
+
+    async def _race_wait_conditions(self, wait_data: Dict[str, Any], seconds: float, page: Page) -> Dict[str, Any]:
+        """
+        Sleep'i element/URL koşullarıyla yarıştırır (FIRST_COMPLETED)
+
+        Koşul sleep bitmeden sağlanırsa kalan uyku iptal edilir; koşul
+        beklemesi hata verirse sleep yine üst sınır olarak devreye girer.
+        """
+        tasks = {asyncio.create_task(asyncio.sleep(seconds)): "sleep"}
+        if wait_data.get("for_element"):
+            tasks[asyncio.create_task(
+                page.wait_for_selector(wait_data["for_element"], timeout=seconds * 1000)
+            )] = "for_element"
+        if wait_data.get("for_url_contains"):
+            fragment = wait_data["for_url_contains"]
+            tasks[asyncio.create_task(
+                page.wait_for_url(f"**/*{fragment}*", timeout=seconds * 1000)
+            )] = "for_url_contains"
+
+        start = time.perf_counter()
+        satisfied = "sleep"
+        pending = set(tasks)
+        # Hata veren koşul (ör. navigation sonrası context kaybı) yarışı
+        # bitirmez: o task düşer, sleep üst sınır olarak beklenmeye devam
+        # eder. Döngü ancak sleep bitince veya bir koşul başarıyla
+        # sağlanınca kırılır.
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            finished = None
+            for task in done:
+                label = tasks[task]
+                if label == "sleep":
+                    if finished is None:
+                        finished = "sleep"
+                elif task.exception() is None:
+                    finished = label
+            if finished is not None:
+                satisfied = finished
+                break
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        return {
+            "action": "wait",
+            "satisfied_by": satisfied,
+            "duration": time.perf_counter() - start
+        }
     
-    async def _execute_screenshot(self, screenshot_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_screenshot(self, screenshot_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
         """Screenshot action'ını çalıştırır"""
+        page = page or self.page
         name = screenshot_data.get("name", "step_screenshot")
         full_page = screenshot_data.get("full_page", False)
+        # JPEG varsayılan: Chromium encoder'ında PNG'den kat kat hızlı ve
+        # dosya 5-10x küçük; kayıpsız gerekiyorsa step format: png der
+        fmt = screenshot_data.get("format", "jpeg")
         
-        filename = f"{name}.png"
+        filename = f"{name}.{'jpg' if fmt == 'jpeg' else 'png'}"
         
-        if not self.page:
+        if not self._initialized:
             return {
                 "status": "error",
                 "message": "Browser page mevcut değil"
             }
         
-        screenshot_path = Path("screenshots") / filename
+        screenshot_path = self._screenshot_dir / filename
         
         try:
-            # Full page screenshot
-            await self.page.screenshot(
-                path=str(screenshot_path),
-                full_page=full_page
+            # Byte'ları al, disk yazmasını arka plana bırak
+            data = await page.screenshot(
+                full_page=full_page,
+                type=fmt,
+                quality=80 if fmt == "jpeg" else None
             )
+            self._flush_screenshot_async(screenshot_path, data)
             
             self.logger.info("Screenshot alındı", filename=filename, full_page=full_page)
             
@@ -461,7 +1085,7 @@ class ExecutorAgent:
             JavaScript execution sonucu
         """
         try:
-            if not self.page:
+            if not self._initialized:
                 return {
                     "status": "error",
                     "message": "Browser page mevcut değil"
@@ -484,18 +1108,134 @@ class ExecutorAgent:
                 "message": f"JavaScript çalıştırılamadı: {str(e)}"
             }
     
-    async def _execute_expect_download(self, download_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def wait_for_settle(self, timeout_ms: int = 3000, quiet_ms: int = 400) -> Dict[str, Any]:
+        """
+        Sayfanın sakinleşmesini bekler (sabit sleep yerine event-driven)
+
+        domcontentloaded sonrası quiet_ms boyunca DOM mutation'ı olmamasını
+        bekler; timeout_ms toplam üst sınırdır. Hazır sayfalarda neredeyse
+        anında döner, yavaş sayfalarda gereksiz erken devam etmez.
+
+        Args:
+            timeout_ms: Toplam bekleme üst sınırı (ms)
+            quiet_ms: Gereken mutation sessizlik penceresi (ms)
+
+        Returns:
+            Bekleme durumu
+        """
+        if not self._initialized:
+            return {
+                "status": "error",
+                "message": "Browser page mevcut değil"
+            }
+
+        try:
+            await self.page.wait_for_load_state("domcontentloaded")
+
+            await self.page.evaluate(
+                """([quietMs, timeoutMs]) => new Promise((resolve) => {
+                    const fallback = setTimeout(done, timeoutMs);
+                    let quietTimer = null;
+                    const observer = new MutationObserver(() => {
+                        clearTimeout(quietTimer);
+                        quietTimer = setTimeout(done, quietMs);
+                    });
+                    function done() {
+                        observer.disconnect();
+                        clearTimeout(fallback);
+                        clearTimeout(quietTimer);
+                        resolve();
+                    }
+                    observer.observe(document.documentElement, { childList: true, subtree: true, attributes: true });
+                    quietTimer = setTimeout(done, quietMs);
+                })""",
+                [quiet_ms, timeout_ms]
+            )
+
+            return {"status": "success", "quiet_ms": quiet_ms}
+
+        except Exception as e:
+            self.logger.warning("Settle bekleme hatası", error=str(e))
+            return {"status": "error", "message": str(e)}
+
+    async def ensure_injected(self, name: str, source: str) -> Dict[str, Any]:
+        """
+        JavaScript fonksiyonunu sayfaya bir kez inject eder
+
+        Aynı script'in kaynak kodunu her çağrıda CDP üzerinden yeniden
+        göndermek yerine fonksiyonu `window.<name>` olarak kurar; sonraki
+        çağrılar `window.<name>()` ile yapılır. Navigation cache'i sıfırlar.
+
+        Args:
+            name: Global fonksiyon adı (örn. "__formAnalyze")
+            source: Fonksiyon kaynağı (arrow function ifadesi)
+
+        Returns:
+            Injection durumu
+        """
+        if name in self._injected_scripts:
+            return {"status": "success", "injected": False}
+
+        result = await self.evaluate_javascript_tool(f"() => {{ window.{name} = {source}; return true; }}")
+
+        if result["status"] == "success":
+            self._injected_scripts.add(name)
+            self.logger.info("Script inject edildi", name=name, script_length=len(source))
+            return {"status": "success", "injected": True}
+
+        return result
+
+    async def call_injected(self, name: str) -> Dict[str, Any]:
+        """Inject edilmiş fonksiyonu ismiyle çağırır"""
+        return await self.evaluate_javascript_tool(f"() => window.{name}()")
+
+    async def scan_page_interactive(self) -> Dict[str, Any]:
+        """
+        Sayfadaki interaktif elementleri tek DOM taramasında toplar
+
+        Form elemanı metadata'sı (input/button/select) ve login-buton
+        adayları aynı geçişte çıkarılır; analyze/find akışları bu sonucun
+        ilgili alanını okur.
+
+        Returns:
+            {status, result: {formElements, loginCandidates, highConfidence, ...}}
+        """
+        # Ucuz DOM parmak izi: sayfa durumu değişmediyse tam tarama
+        # tekrarlanmaz, önceki sonuç aynen döner
+        fp_result = await self.evaluate_javascript_tool(
+            "() => document.body.childElementCount + '|' + document.lastModified + '|' + location.href"
+        )
+        fingerprint = fp_result["result"] if fp_result["status"] == "success" else None
+        if fingerprint is not None and fingerprint == self._last_dom_fp and self._last_scan is not None:
+            return self._last_scan
+
+        # Fonksiyon normalde context init script'iyle hazırdır; init
+        # script'in kurulmadığı context'lerde (örn. dışarıdan verilen page)
+        # ensure_injected fallback'i devreye girer
+        result = await self.call_injected("__scanPageInteractive")
+        if result["status"] != "success":
+            inject_result = await self.ensure_injected("__scanPageInteractive", _SCAN_PAGE_INTERACTIVE_JS)
+            if inject_result["status"] != "success":
+                return inject_result
+            result = await self.call_injected("__scanPageInteractive")
+        if fingerprint is not None and result["status"] == "success":
+            self._last_dom_fp = fingerprint
+            self._last_scan = result
+        return result
+
+    async def _execute_expect_download(self, download_data: Dict[str, Any], page: Optional[Page] = None) -> Dict[str, Any]:
         """Download bekleme action'ını çalıştırır"""
-        self.logger.info("Download bekleniyor", download_data=download_data)
+        self.logger.debug("Download bekleniyor", download_data=download_data)
+        page = page or self.page
         
         try:
             # Download event'ini bekle
-            async with self.page.expect_download(timeout=30000) as download_info:
+            async with page.expect_download(timeout=30000) as download_info:
                 # Download'ı tetikleyecek elementi tıkla
                 if "trigger_selector" in download_data:
-                    await self.page.click(download_data["trigger_selector"])
+                    await page.click(download_data["trigger_selector"])
                 elif "trigger_text" in download_data:
-                    await self.page.click(f"text={download_data['trigger_text']}")
+                    await page.click(f"text={download_data['trigger_text']}")
             
             download = await download_info.value
             
@@ -516,18 +1256,5 @@ class ExecutorAgent:
             raise TimeoutError(f"Download başlatılamadı: {str(e)}")
 
     def _classify_error(self, error_message: str) -> str:
-        """Hata tipini sınıflandırır"""
-        error_lower = error_message.lower()
-        
-        if "timeout" in error_lower:
-            return "timeout"
-        elif "not found" in error_lower or "element" in error_lower:
-            return "element_not_found"
-        elif "navigation" in error_lower or "load" in error_lower:
-            return "navigation_failed"
-        elif "network" in error_lower:
-            return "network_error"
-        elif "assertion" in error_lower:
-            return "assertion_failed"
-        else:
-            return "unknown" 
\ No newline at end of file
+        """Hata tipini sınıflandırır (memoize edilmiş tek regex taraması)"""
+        return _classify_error_message(error_message) 
\ No newline at end of file
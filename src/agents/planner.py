@@ -4,10 +4,41 @@ Test senaryolarını analiz eder ve execution planı oluşturur.
 """
 
 from typing import List, Dict, Any
+import functools
+from collections import Counter
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Bilinen assertion step anahtarları: startswith taraması yerine C
+# seviyesinde küme işlemiyle kontrol edilir
+_ASSERT_KEYS = frozenset({"assert_url_contains", "assert_url_not_contains"})
+
+# Alternatif selector şablonları: f-string'leri her recovery çağrısında
+# yeniden kurmak yerine şablonlar bir kez tanımlanır, sonuç text/label
+# başına memoize edilir (retry fırtınalarında aynı step tekrar gelir)
+_CLICK_SELECTOR_TPLS = (
+    "button:has-text('{0}')",
+    "[aria-label*='{0}']",
+    "a:has-text('{0}')",
+    "input[value='{0}']",
+)
+_FILL_SELECTOR_TPLS = (
+    "input[placeholder*='{0}']",
+    "label:has-text('{0}') + input",
+    "[aria-label*='{0}']",
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _click_alternatives(text: str) -> tuple:
+    return tuple(tpl.format(text) for tpl in _CLICK_SELECTOR_TPLS)
+
+
+@functools.lru_cache(maxsize=512)
+def _fill_alternatives(label: str) -> tuple:
+    return tuple(tpl.format(label) for tpl in _FILL_SELECTOR_TPLS)
+
 
 class PlannerAgent:
     """
@@ -21,6 +52,12 @@ class PlannerAgent:
     def __init__(self, llm_model: str = "gpt-4o-mini"):
         self.logger = logger.bind(agent="planner")
         self.llm_model = llm_model
+        # Action tipine göre risk değerlendirici tablosu: her step'te tüm
+        # action bloklarını yoklamak yerine sadece ilgili olan çalışır
+        self._risk_assessors = {
+            "fill": self._assess_fill_risk,
+            "click": self._assess_click_risk,
+        }
     
     def analyze_scenario_tool(self, scenario_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -32,19 +69,25 @@ class PlannerAgent:
         Returns:
             Analysis sonuçları ve öneriler
         """
-        self.logger.info("Senaryo analizi başlıyor", steps_count=len(scenario_data.get("steps", [])))
+        # Tek sefer bağlanır; miss durumunda yeni liste de üretilmez
+        steps = scenario_data.get("steps") or ()
+
+        self.logger.info("Senaryo analizi başlıyor", steps_count=len(steps))
         
         analysis = {
-            "total_steps": len(scenario_data.get("steps", [])),
+            "total_steps": len(steps),
             "risk_areas": [],
             "complexity_score": 0,
             "estimated_duration": 0,
             "recommendations": []
         }
         
-        steps = scenario_data.get("steps", [])
+        # Action sayıları risk döngüsüyle aynı geçişte toplanır; öneriler
+        # için step listesi ikinci kez taranmaz
+        kinds = Counter()
         
         for i, step in enumerate(steps):
+            kinds.update(step.keys())
             step_risk = self._assess_step_risk(step, i)
             if step_risk["risk_level"] > 2:
                 analysis["risk_areas"].append({
@@ -61,7 +104,7 @@ class PlannerAgent:
         if analysis["complexity_score"] > 15:
             analysis["recommendations"].append("Senaryoyu daha küçük parçalara böl")
         
-        if len([s for s in steps if "fill" in s]) > 5:
+        if kinds["fill"] > 5:
             analysis["recommendations"].append("Form step'lerini batch'le, page loading'e dikkat et")
             
         self.logger.info("Senaryo analizi tamamlandı", 
@@ -83,6 +126,8 @@ class PlannerAgent:
         """
         self.logger.info("Execution planı oluşturuluyor")
         
+        steps = scenario_data.get("steps") or ()
+        
         plan = {
             "execution_strategy": "sequential",  # sequential, parallel, batch
             "timeout_strategy": "adaptive",      # fixed, adaptive, aggressive  
@@ -103,18 +148,37 @@ class PlannerAgent:
             plan["checkpoints"].append(checkpoint)
         
         # Recovery point'leri belirle
-        steps = scenario_data.get("steps", [])
         for i, step in enumerate(steps):
-            if "assert" in str(step) or i == len(steps) - 1:
+            # str(step) tüm dict'i serialize edip substring arıyordu; key
+            # bazlı küme kontrolü ayırma yapmaz ve fill değerlerindeki
+            # "assert" geçişlerine yanlış pozitif vermez
+            if not _ASSERT_KEYS.isdisjoint(step) or i == len(steps) - 1:
                 plan["recovery_points"].append({
                     "step_index": i,
                     "type": "assertion_point",
                     "fallback_action": "retry_from_last_checkpoint"
                 })
         
-        self.logger.info("Execution planı oluşturuldu", 
+        # Ardışık assertion step'leri browser state'ini değiştirmez:
+        # paralel çalıştırılabilir grup olarak işaretle
+        current_group = []
+        for i, step in enumerate(steps):
+            if step and _ASSERT_KEYS.issuperset(step):
+                current_group.append(i)
+            else:
+                if len(current_group) > 1:
+                    plan["parallel_groups"].append(current_group)
+                current_group = []
+        if len(current_group) > 1:
+            plan["parallel_groups"].append(current_group)
+
+        if plan["parallel_groups"]:
+            plan["execution_strategy"] = "parallel"
+
+        self.logger.info("Execution planı oluşturuldu",
                         checkpoints=len(plan["checkpoints"]),
-                        recovery_points=len(plan["recovery_points"]))
+                        recovery_points=len(plan["recovery_points"]),
+                        parallel_groups=len(plan["parallel_groups"]))
         
         return plan
     
@@ -135,13 +199,21 @@ class PlannerAgent:
             "max_attempts": 3,
             "fallback_actions": [],
             "alternative_selectors": [],
-            "skip_conditions": []
+            "skip_conditions": [],
+            # Retry zamanlama parametreleri (error tipine göre aşağıda ayarlanır)
+            "retry_timeout": 30,
+            "backoff_base": 0.5,
+            "backoff_cap": 8.0,
+            "backoff_jitter": 0.25
         }
         
         error_type = error_context.get("error_type", "unknown")
         failed_step = error_context.get("failed_step", {})
         
         if error_type == "timeout":
+            # Zaten yavaş olan sayfaya agresif retry yüklenme
+            recovery_plan["retry_timeout"] = 45
+            recovery_plan["backoff_base"] = 1.0
             recovery_plan["fallback_actions"].extend([
                 {"type": "wait", "duration": 2},
                 {"type": "scroll_to_element"},
@@ -150,6 +222,7 @@ class PlannerAgent:
         elif error_type == "element_not_found":
             recovery_plan["alternative_selectors"] = self._generate_alternative_selectors(failed_step)
         elif error_type == "navigation_failed":
+            recovery_plan["retry_timeout"] = 60
             recovery_plan["fallback_actions"].extend([
                 {"type": "refresh_page"},
                 {"type": "clear_cookies"},
@@ -168,49 +241,44 @@ class PlannerAgent:
             "mitigation": []
         }
         
-        # Fill action riskleri
-        if "fill" in step:
-            fill_data = step["fill"]
-            if not fill_data.get("selector") and not fill_data.get("label"):
-                risk_assessment["risks"].append("Zayıf element locator")
-                risk_assessment["risk_level"] += 1
-                risk_assessment["mitigation"].append("Label veya güçlü selector kullan")
-        
-        # Click action riskleri  
-        if "click" in step:
-            click_data = step["click"]
-            if click_data.get("text") and len(click_data["text"]) < 3:
-                risk_assessment["risks"].append("Çok kısa button text")
-                risk_assessment["risk_level"] += 1
+        # Sadece step'in kendi action'ının değerlendiricisi çalışır
+        for key in step:
+            assessor = self._risk_assessors.get(key)
+            if assessor:
+                assessor(step[key], risk_assessment)
         
         # Assertion riskleri
-        if any(key.startswith("assert") for key in step.keys()):
+        if not _ASSERT_KEYS.isdisjoint(step):
             risk_assessment["risks"].append("Assertion step - kritik kontrol noktası")
             risk_assessment["complexity"] += 2
         
         return risk_assessment
     
+    def _assess_fill_risk(self, fill_data: Dict[str, Any], risk_assessment: Dict[str, Any]) -> None:
+        """Fill action riskleri"""
+        if not fill_data.get("selector") and not fill_data.get("label"):
+            risk_assessment["risks"].append("Zayıf element locator")
+            risk_assessment["risk_level"] += 1
+            risk_assessment["mitigation"].append("Label veya güçlü selector kullan")
+    
+    def _assess_click_risk(self, click_data: Dict[str, Any], risk_assessment: Dict[str, Any]) -> None:
+        """Click action riskleri"""
+        if click_data.get("text") and len(click_data["text"]) < 3:
+            risk_assessment["risks"].append("Çok kısa button text")
+            risk_assessment["risk_level"] += 1
+    
     def _generate_alternative_selectors(self, failed_step: Dict[str, Any]) -> List[str]:
-        """Failed step için alternatif selector'lar üretir"""
+        """Failed step için alternatif selector'lar üretir (memoized)"""
         alternatives = []
         
         if "click" in failed_step:
             text = failed_step["click"].get("text", "")
             if text:
-                alternatives.extend([
-                    f"button:has-text('{text}')",
-                    f"[aria-label*='{text}']",
-                    f"a:has-text('{text}')",
-                    f"input[value='{text}']"
-                ])
+                alternatives.extend(_click_alternatives(text))
         
         if "fill" in failed_step:
             label = failed_step["fill"].get("label", "")
             if label:
-                alternatives.extend([
-                    f"input[placeholder*='{label}']",
-                    f"label:has-text('{label}') + input",
-                    f"[aria-label*='{label}']"
-                ])
+                alternatives.extend(_fill_alternatives(label))
         
         return alternatives 
\ No newline at end of file
@@ -3,14 +3,66 @@ Verifier Agent
 Test sonuçlarını doğrular ve raporlar.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, BinaryIO
+import json
+import os
 import structlog
+from collections import defaultdict
 from datetime import datetime
-from pathlib import Path
+
+# orjson varsa rapor serileştirmede kullanılır (runner ile aynı desen)
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = structlog.get_logger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Objeyi JSON bytes'a çevirir; orjson yoksa stdlib json'a düşer"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+# Öneri metinleri: her çağrıda yeni string kurmak yerine modül sabitleri
+_REC_WAIT_STRATEGY = "Test stability'sini artırmak için wait strategy'leri ekleyin"
+_REC_PARALLEL = "Test performance'ını artırmak için paralel execution düşünün"
+_REC_SELECTORS = "Critical failure'ları önlemek için selector'ları güçlendirin"
+
+
+def _scan_artifacts(dirname: str, suffixes: tuple) -> List[str]:
+    """Dizindeki eşleşen dosya yollarını döndürür
+
+    os.scandir her entry için Path objesi kurmaz ve fnmatch çalıştırmaz;
+    binlerce screenshot'lı koşularda glob'dan belirgin hızlıdır.
+    """
+    try:
+        return [
+            entry.path for entry in os.scandir(dirname)
+            if entry.is_file() and entry.name.endswith(suffixes)
+        ]
+    except FileNotFoundError:
+        return []
+
+
+# Error tipi -> (root cause, fix önerisi): elif zinciri yerine sabit tablo
+_ROOT_CAUSE_TABLE = {
+    "timeout": (
+        "Sayfa yüklenme süreleri yavaş olabilir",
+        "Timeout değerlerini artır veya wait stratejisi ekle",
+    ),
+    "element_not_found": (
+        "DOM değişiklikleri veya zayıf selector'lar",
+        "Daha güçlü selector'lar kullan veya wait condition ekle",
+    ),
+    "navigation_failed": (
+        "Network connectivity veya server sorunları",
+        "Network retry policy ekle",
+    ),
+}
+
+
 class VerifierAgent:
     """
     Test doğrulama ve raporlamadan sorumlu agent
@@ -34,8 +86,9 @@ class VerifierAgent:
         Returns:
             Verification sonuçları
         """
-        self.logger.info("Test sonuçları doğrulanıyor", 
-                        total_steps=len(execution_results.get("steps", [])))
+        steps = execution_results.get("steps", [])
+
+        self.logger.info("Test sonuçları doğrulanıyor", total_steps=len(steps))
         
         verification = {
             "overall_status": "unknown",
@@ -49,11 +102,26 @@ class VerifierAgent:
             "test_quality_score": 0.0
         }
         
-        steps = execution_results.get("steps", [])
         verification["total_steps"] = len(steps)
         
+        # Tek geçiş: status sayaçları, kalite skoru için action çeşitliliği
+        # ve warning tespiti için yavaş/retry sayaçları aynı döngüde toplanır
+        action_types = set()
+        slow_count = 0
+        retry_count = 0
+        
         for step_result in steps:
-            status = step_result.get("status", "unknown")
+            # get bir kez bağlanır: iterasyon başına 4-6 metot çözümlemesi
+            # tek LOAD_FAST'a iner
+            get = step_result.get
+            status = get("status", "unknown")
+            action_types.add(get("action", "unknown"))
+            if get("duration", 0) > 5.0:
+                slow_count += 1
+            # Executor retry yaptıysa retried flag'i koyar; eski sonuçlar
+            # için error string fallback'i korunur
+            if get("retried") or "retry" in str(get("error", "")):
+                retry_count += 1
             
             if status == "success":
                 verification["passed_steps"] += 1
@@ -63,9 +131,9 @@ class VerifierAgent:
                 # Critical failure kontrolü
                 if self._is_critical_failure(step_result):
                     verification["critical_failures"].append({
-                        "step_index": step_result.get("step_index"),
-                        "error": step_result.get("error"),
-                        "error_type": step_result.get("error_type"),
+                        "step_index": get("step_index"),
+                        "error": get("error"),
+                        "error_type": get("error_type"),
                         "impact": "critical"
                     })
             else:
@@ -86,10 +154,10 @@ class VerifierAgent:
             verification["overall_status"] = "failed"
         
         # Test kalite skoru hesaplama
-        verification["test_quality_score"] = self._calculate_quality_score(verification, steps)
+        verification["test_quality_score"] = self._calculate_quality_score(verification, len(action_types))
         
         # Warning'leri tespit et
-        verification["warnings"] = self._detect_warnings(steps, verification)
+        verification["warnings"] = self._detect_warnings(slow_count, retry_count, verification)
         
         self.logger.info("Verification tamamlandı",
                         status=verification["overall_status"],
@@ -144,22 +212,13 @@ class VerifierAgent:
             }
         }
         
-        # Step detaylarını ekle
+        # Step detayları: comprehension append döngüsünden daha az opcode
+        # dispatch eder
         steps = execution_results.get("steps", [])
-        for i, step_result in enumerate(steps):
-            step_detail = {
-                "index": i,
-                "action": step_result.get("action", "unknown"),
-                "status": step_result.get("status", "unknown"),
-                "duration": step_result.get("duration", 0),
-                "target": step_result.get("target") or step_result.get("url") or "N/A"
-            }
-            
-            if step_result.get("status") == "error":
-                step_detail["error"] = step_result.get("error")
-                step_detail["error_type"] = step_result.get("error_type")
-            
-            report["step_details"].append(step_detail)
+        report["step_details"] = [
+            self._build_step_detail(i, step_result)
+            for i, step_result in enumerate(steps)
+        ]
         
         # Önerileri oluştur
         report["recommendations"] = self._generate_recommendations(
@@ -174,6 +233,87 @@ class VerifierAgent:
         
         return report
     
+    def generate_test_report_stream(self,
+                                    scenario_data: Dict[str, Any],
+                                    execution_results: Dict[str, Any],
+                                    verification_results: Dict[str, Any],
+                                    out_fp: BinaryIO) -> None:
+        """
+        Test raporunu out_fp'ye akıtarak yazar
+
+        generate_test_report_tool ile aynı yapıyı üretir ama step_details
+        listesini bellekte biriktirmez: her detay üretilir üretilmez
+        serileştirilip yazılır. Binlerce step'li koşularda tepe bellek
+        kullanımı dict + JSON string çiftlemesinin yarısına iner.
+
+        Args:
+            scenario_data: Orijinal YAML scenario
+            execution_results: Execution sonuçları
+            verification_results: Verification sonuçları
+            out_fp: Binary modda açılmış hedef dosya objesi
+        """
+        self.logger.info("Test raporu stream ediliyor")
+
+        metadata = {
+            "test_name": scenario_data.get("name", "Unnamed Test"),
+            "timestamp": datetime.now().isoformat(),
+            "duration": execution_results.get("total_duration", 0),
+            "browser": scenario_data.get("browser", "chromium"),
+            "headless": scenario_data.get("headless", True)
+        }
+        summary = {
+            "overall_status": verification_results["overall_status"],
+            "total_steps": verification_results["total_steps"],
+            "passed": verification_results["passed_steps"],
+            "failed": verification_results["failed_steps"],
+            "success_rate": verification_results["success_rate"],
+            "quality_score": verification_results["test_quality_score"]
+        }
+
+        write = out_fp.write
+        write(b'{"metadata":')
+        write(_dumps(metadata))
+        write(b',"summary":')
+        write(_dumps(summary))
+        write(b',"step_details":[')
+        for i, step_result in enumerate(execution_results.get("steps", [])):
+            if i:
+                write(b",")
+            write(_dumps(self._build_step_detail(i, step_result)))
+        write(b'],"failures":')
+        write(_dumps(verification_results.get("critical_failures", [])))
+        write(b',"warnings":')
+        write(_dumps(verification_results.get("warnings", [])))
+        write(b',"recommendations":')
+        write(_dumps(self._generate_recommendations(
+            verification_results, execution_results, scenario_data
+        )))
+        write(b',"artifacts":')
+        write(_dumps(self._collect_artifacts(execution_results)))
+        write(b"}")
+
+        self.logger.info("Test raporu stream edildi",
+                        report_status=summary["overall_status"])
+
+    @staticmethod
+    def _build_step_detail(index: int, step_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Tek step için rapor detayı üretir"""
+        get = step_result.get
+        status = get("status", "unknown")
+        detail = {
+            "index": index,
+            "action": get("action", "unknown"),
+            "status": status,
+            "duration": get("duration", 0),
+            "target": get("target") or get("url") or "N/A"
+        }
+        
+        if status == "error":
+            detail["error"] = get("error")
+            detail["error_type"] = get("error_type")
+        
+        return detail
+    
     def analyze_failures_tool(self, failure_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Hata detaylarını analiz eder ve pattern'leri tespit eder
@@ -196,27 +336,19 @@ class VerifierAgent:
         if not failure_data:
             return analysis
         
-        # Hata pattern'lerini grupla
-        error_types = {}
+        # Hata pattern'lerini grupla (tek hash lookup per failure)
+        error_types = defaultdict(list)
         for failure in failure_data:
-            error_type = failure.get("error_type", "unknown")
-            if error_type not in error_types:
-                error_types[error_type] = []
-            error_types[error_type].append(failure)
-        
-        analysis["failure_patterns"] = error_types
-        
-        # Root cause analizi
-        for error_type, failures in error_types.items():
-            if error_type == "timeout":
-                analysis["root_causes"].append("Sayfa yüklenme süreleri yavaş olabilir")
-                analysis["fix_suggestions"].append("Timeout değerlerini artır veya wait stratejisi ekle")
-            elif error_type == "element_not_found":
-                analysis["root_causes"].append("DOM değişiklikleri veya zayıf selector'lar")
-                analysis["fix_suggestions"].append("Daha güçlü selector'lar kullan veya wait condition ekle")
-            elif error_type == "navigation_failed":
-                analysis["root_causes"].append("Network connectivity veya server sorunları")
-                analysis["fix_suggestions"].append("Network retry policy ekle")
+            error_types[failure.get("error_type", "unknown")].append(failure)
+        
+        analysis["failure_patterns"] = dict(error_types)
+        
+        # Root cause analizi: string karşılaştırma zinciri yerine tablo
+        for error_type in error_types:
+            entry = _ROOT_CAUSE_TABLE.get(error_type)
+            if entry:
+                analysis["root_causes"].append(entry[0])
+                analysis["fix_suggestions"].append(entry[1])
         
         # Impact assessment
         total_failures = len(failure_data)
@@ -227,63 +359,78 @@ class VerifierAgent:
         
         return analysis
     
-    def validate_assertions_tool(self, assertion_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_assertions_tool(self, assertion_results: List[Dict[str, Any]], details: bool = True) -> Dict[str, Any]:
         """
         Assertion sonuçlarını detaylı olarak doğrular
         
         Args:
             assertion_results: Assertion step sonuçları
+            details: False ise per-assertion detay dict'leri üretilmez
+                     (sadece sayaçlarla ilgilenen çağıranlar için)
             
         Returns:
             Assertion validation sonuçları
         """
-        self.logger.info("Assertion'lar doğrulanıyor", count=len(assertion_results))
+        total = len(assertion_results)
+        self.logger.info("Assertion'lar doğrulanıyor", count=total)
+        
+        passed = sum(1 for a in assertion_results if a.get("passed", False))
+        
+        # Yaygın durum: hepsi geçti — detay dict'leri kurmadan dön
+        if passed == total:
+            return {
+                "total_assertions": total,
+                "passed_assertions": total,
+                "failed_assertions": 0,
+                "assertion_details": [
+                    self._build_assertion_detail(a) for a in assertion_results
+                ] if details else [],
+                "confidence_score": 1.0
+            }
         
+        failed = total - passed
         validation = {
-            "total_assertions": len(assertion_results),
-            "passed_assertions": 0,
-            "failed_assertions": 0,
+            "total_assertions": total,
+            "passed_assertions": passed,
+            "failed_assertions": failed,
             "assertion_details": [],
-            "confidence_score": 1.0
+            "confidence_score": 0.8 ** failed
         }
         
-        for assertion in assertion_results:
-            detail = {
-                "type": assertion.get("action", "unknown"),
-                "expected": assertion.get("fragment"),
-                "actual": assertion.get("current_url"),
-                "passed": assertion.get("passed", False),
-                "confidence": 1.0
-            }
-            
-            if detail["passed"]:
-                validation["passed_assertions"] += 1
-            else:
-                validation["failed_assertions"] += 1
-                # Failed assertion'lar için confidence düşür
-                validation["confidence_score"] *= 0.8
-            
-            validation["assertion_details"].append(detail)
+        if details:
+            validation["assertion_details"] = [
+                self._build_assertion_detail(a) for a in assertion_results
+            ]
         
         return validation
     
+    @staticmethod
+    def _build_assertion_detail(assertion: Dict[str, Any]) -> Dict[str, Any]:
+        """Tek assertion için detay dict'i üretir"""
+        get = assertion.get
+        return {
+            "type": get("action", "unknown"),
+            "expected": get("fragment"),
+            "actual": get("current_url"),
+            "passed": get("passed", False),
+            "confidence": 1.0
+        }
+    
     def _is_critical_failure(self, step_result: Dict[str, Any]) -> bool:
-        """Step failure'ının critical olup olmadığını belirler"""
-        error_type = step_result.get("error_type", "")
-        action = step_result.get("action", "")
-        
-        # Assertion failure'ları her zaman critical
-        if action.startswith("assert"):
-            return True
-        
-        # Navigation failure'ları critical
-        if error_type == "navigation_failed":
-            return True
-        
-        return False
+        """Step failure'ının critical olup olmadığını belirler
+
+        Assertion failure'ları ve navigation failure'ları critical'dır.
+        """
+        get = step_result.get
+        # Execution fazı flag'i üretim anında koyar; koymadıysa (ör. tek
+        # başına çağrılan verifier) prefix testi fallback olarak kalır
+        is_assertion = get("is_assertion")
+        if is_assertion is None:
+            is_assertion = get("action", "").startswith("assert")
+        return bool(is_assertion) or get("error_type", "") == "navigation_failed"
     
-    def _calculate_quality_score(self, verification: Dict[str, Any], steps: List[Dict[str, Any]]) -> float:
-        """Test kalite skorunu hesaplar"""
+    def _calculate_quality_score(self, verification: Dict[str, Any], action_type_count: int) -> float:
+        """Test kalite skorunu hesaplar (çeşitlilik ana döngüde sayılmıştır)"""
         base_score = verification["success_rate"]
         
         # Critical failure penalty
@@ -291,31 +438,25 @@ class VerifierAgent:
         critical_penalty = critical_count * 0.2
         
         # Step çeşitliliği bonusu
-        action_types = set()
-        for step in steps:
-            action_types.add(step.get("action", "unknown"))
-        
-        diversity_bonus = min(len(action_types) * 0.1, 0.3)
+        diversity_bonus = min(action_type_count * 0.1, 0.3)
         
         quality_score = max(0.0, min(1.0, base_score - critical_penalty + diversity_bonus))
         
         return round(quality_score, 2)
     
-    def _detect_warnings(self, steps: List[Dict[str, Any]], verification: Dict[str, Any]) -> List[str]:
-        """Test execution'da warning'leri tespit eder"""
+    def _detect_warnings(self, slow_count: int, retry_count: int, verification: Dict[str, Any]) -> List[str]:
+        """Test execution'da warning'leri tespit eder (sayaçlar ana döngüden gelir)"""
         warnings = []
         
         # Yavaş step'ler
-        slow_steps = [s for s in steps if s.get("duration", 0) > 5.0]
-        if slow_steps:
-            warnings.append(f"{len(slow_steps)} adım 5 saniyeden uzun sürdü")
+        if slow_count:
+            warnings.append(f"{slow_count} adım 5 saniyeden uzun sürdü")
         
         # Success rate uyarıları
         if 0.8 <= verification["success_rate"] < 1.0:
             warnings.append("Test başarı oranı ideal seviyenin altında")
         
         # Çok fazla retry
-        retry_count = sum(1 for s in steps if "retry" in str(s.get("error", "")))
         if retry_count > 2:
             warnings.append("Çok fazla retry gerekti, test stability problemi olabilir")
         
@@ -329,41 +470,33 @@ class VerifierAgent:
         
         # Success rate bazlı öneriler
         if verification["success_rate"] < 0.8:
-            recommendations.append("Test stability'sini artırmak için wait strategy'leri ekleyin")
+            recommendations.append(_REC_WAIT_STRATEGY)
         
         # Performance önerileri
         total_duration = execution.get("total_duration", 0)
         step_count = verification["total_steps"]
         if step_count > 0 and (total_duration / step_count) > 3.0:
-            recommendations.append("Test performance'ını artırmak için paralel execution düşünün")
+            recommendations.append(_REC_PARALLEL)
         
         # Maintenance önerileri
-        if len(verification["critical_failures"]) > 0:
-            recommendations.append("Critical failure'ları önlemek için selector'ları güçlendirin")
+        if verification["critical_failures"]:
+            recommendations.append(_REC_SELECTORS)
         
         return recommendations
     
+    # Artifact dizin adları ve uzantıları; her rapor için aynı literal'leri
+    # yeniden kurmak yerine sınıf sabitlerinden okunur
+    _SCREENSHOTS_DIR = "screenshots"
+    _TRACES_DIR = "traces"
+    _LOGS_DIR = "logs"
+    _SCREENSHOT_SUFFIXES = (".png", ".jpg")
+    _TRACE_SUFFIXES = (".zip",)
+    _LOG_SUFFIXES = (".log",)
+
     def _collect_artifacts(self, execution_results: Dict[str, Any]) -> Dict[str, List[str]]:
         """Test artifact'lerini toplar"""
-        artifacts = {
-            "screenshots": [],
-            "traces": [],
-            "logs": []
-        }
-        
-        # Screenshot dosyalarını bul
-        screenshots_dir = Path("screenshots")
-        if screenshots_dir.exists():
-            artifacts["screenshots"] = [str(f) for f in screenshots_dir.glob("*.png")]
-        
-        # Trace dosyalarını bul
-        traces_dir = Path("traces")
-        if traces_dir.exists():
-            artifacts["traces"] = [str(f) for f in traces_dir.glob("*.zip")]
-        
-        # Log dosyalarını bul
-        logs_dir = Path("logs")
-        if logs_dir.exists():
-            artifacts["logs"] = [str(f) for f in logs_dir.glob("*.log")]
-        
-        return artifacts 
\ No newline at end of file
+        return {
+            "screenshots": _scan_artifacts(self._SCREENSHOTS_DIR, self._SCREENSHOT_SUFFIXES),
+            "traces": _scan_artifacts(self._TRACES_DIR, self._TRACE_SUFFIXES),
+            "logs": _scan_artifacts(self._LOGS_DIR, self._LOG_SUFFIXES),
+        } 
\ No newline at end of file
@@ -10,6 +10,8 @@ from pydantic import BaseModel, Field
 class GotoAction(BaseModel):
     """Belirtilen URL'ye git"""
     url: str = Field(..., description="Gidilecek URL")
+    wait_until: Optional[str] = Field(None, description="Navigation bekleme stratejisi (domcontentloaded/load/networkidle)")
+    expected_selector: Optional[str] = Field(None, description="Navigation sonrası beklenecek selector")
 
 
 class FillAction(BaseModel):
@@ -55,6 +57,7 @@ class ScreenshotAction(BaseModel):
     """Ekran görüntüsü al"""
     name: str = Field(..., description="Screenshot dosya adı")
     full_page: bool = Field(False, description="Tam sayfa screenshot")
+    format: Optional[str] = Field("jpeg", description="Görüntü formatı (jpeg/png)")
 
 
 # Action Union Type - Tüm action türlerini birleştiren union
@@ -4,7 +4,17 @@ YAML test senaryolarının ana yapısını tanımlar.
 """
 
 from typing import List, Optional, Union, Any, Dict
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+from .actions import GotoAction, FillAction, ClickAction, SelectAction, WaitAction, ScreenshotAction
+
+# Action alanlarının isimleri; validasyon tek geçişte bu tuple üzerinden
+# yapılır ve aktif action adı step'e bir kez yazılır
+_ACTION_FIELDS = (
+    "goto", "fill", "click", "click_and_wait_url", "select",
+    "assert_url_not_contains", "assert_url_contains",
+    "wait", "screenshot", "expect_download",
+)
 
 
 class Step(BaseModel):
@@ -12,23 +22,27 @@ class Step(BaseModel):
     Test adımı - YAML'deki her bir step'i temsil eder
     Sadece bir action türü aktif olabilir
     """
+    # Step'ler yüklendikten sonra salt okunur gezilir; frozen hem yanlışlıkla
+    # mutasyonu engeller hem de pydantic'in instance sözlüğünü sadeleştirir
+    model_config = ConfigDict(frozen=True)
     # Navigation actions
-    goto: Optional[str] = Field(None, description="URL'ye git")
+    goto: Optional[Union[str, GotoAction]] = Field(None, description="URL'ye git (dict formu wait_until override'ı taşır)")
     
     # Form actions  
-    fill: Optional[Dict[str, Any]] = Field(None, description="Form alanını doldur")
-    click: Optional[Dict[str, Any]] = Field(None, description="Elemente tıkla")
-    select: Optional[Dict[str, Any]] = Field(None, description="Dropdown seçimi")
+    fill: Optional[FillAction] = Field(None, description="Form alanını doldur")
+    click: Optional[ClickAction] = Field(None, description="Elemente tıkla")
+    click_and_wait_url: Optional[Dict[str, Any]] = Field(None, description="Tıkla ve URL değişimini bekle (tek CDP turu)")
+    select: Optional[SelectAction] = Field(None, description="Dropdown seçimi")
     
     # Assertion actions
     assert_url_not_contains: Optional[str] = Field(None, description="URL assertion")
     assert_url_contains: Optional[str] = Field(None, description="URL assertion")
     
     # Wait actions
-    wait: Optional[Dict[str, Any]] = Field(None, description="Bekleme aksiyonu")
+    wait: Optional[WaitAction] = Field(None, description="Bekleme aksiyonu")
     
     # Screenshot action
-    screenshot: Optional[Dict[str, Any]] = Field(None, description="Ekran görüntüsü")
+    screenshot: Optional[ScreenshotAction] = Field(None, description="Ekran görüntüsü")
     
     # Download action
     expect_download: Optional[Dict[str, Any]] = Field(None, description="Download bekleme")
@@ -36,16 +50,14 @@ class Step(BaseModel):
     # Meta bilgi
     description: Optional[str] = Field(None, description="Step açıklaması")
     
+    # Aktif action adı validasyonda bir kez hesaplanır; getter'lar zincirli
+    # None kontrolü yapmak yerine bu değeri okur
+    _action_type: Optional[str] = PrivateAttr(None)
+    
     @model_validator(mode='after')
     def validate_single_action(self):
         """Sadece bir action türü aktif olabilir"""
-        actions = [
-            self.goto, self.fill, self.click, self.select,
-            self.assert_url_not_contains, self.assert_url_contains,
-            self.wait, self.screenshot, self.expect_download
-        ]
-        
-        active_actions = [action for action in actions if action is not None]
+        active_actions = [name for name in _ACTION_FIELDS if getattr(self, name) is not None]
         
         if len(active_actions) == 0:
             raise ValueError("Her step'te en az bir action olmalı")
@@ -53,41 +65,24 @@ class Step(BaseModel):
         if len(active_actions) > 1:
             raise ValueError("Her step'te sadece bir action olabilir")
         
+        self._action_type = active_actions[0]
         return self
     
     def get_action_type(self) -> str:
         """Aktif action türünü döndürür"""
-        if self.goto is not None:
-            return "goto"
-        elif self.fill is not None:
-            return "fill"
-        elif self.click is not None:
-            return "click"
-        elif self.select is not None:
-            return "select"
-        elif self.assert_url_not_contains is not None:
-            return "assert_url_not_contains"
-        elif self.assert_url_contains is not None:
-            return "assert_url_contains"
-        elif self.wait is not None:
-            return "wait"
-        elif self.screenshot is not None:
-            return "screenshot"
-        elif self.expect_download is not None:
-            return "expect_download"
-        else:
-            raise ValueError("Geçersiz action türü")
+        return self._action_type
     
     def get_action_data(self) -> Any:
         """Aktif action'ın verisini döndürür"""
-        action_type = self.get_action_type()
-        return getattr(self, action_type)
+        return getattr(self, self._action_type)
 
 
 class Scenario(BaseModel):
     """
     Test senaryosu - YAML dosyasının ana yapısı
     """
+    model_config = ConfigDict(frozen=True)
+
     name: Optional[str] = Field(None, description="Senaryo adı")
     description: Optional[str] = Field(None, description="Senaryo açıklaması")
     browser: Optional[str] = Field("chromium", description="Kullanılacak tarayıcı")
@@ -4,6 +4,7 @@ Environment değişkenleri ve ayarları yönetir.
 """
 
 import os
+from functools import cached_property
 from typing import Optional, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
@@ -15,7 +16,10 @@ class Config:
     Environment değişkenleri ve default ayarları yönetir
     """
     
-    def __init__(self, env_file: Optional[str] = None):
+    def __init__(self, env_file: Optional[str] = None, overrides: Optional[Dict[str, str]] = None):
+        # CLI override'ları: environment'a yazmak yerine instance'ta tutulur
+        self._overrides = dict(overrides) if overrides else {}
+
         # .env dosyasını yükle
         if env_file:
             load_dotenv(env_file)
@@ -25,99 +29,109 @@ class Config:
             env_path = workspace_root / ".env"
             if env_path.exists():
                 load_dotenv(env_path)
-    
+
+    # Değerler cached_property ile ilk erişimde hesaplanıp donar: env bir
+    # kez __init__'te yüklenir, her okumada os.getenv + int/lower dönüşümü
+    # tekrarlanmaz
+    def _get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Override > environment > default önceliğiyle değer döndürür"""
+        if key in self._overrides:
+            return self._overrides[key]
+        return os.getenv(key, default)
+
     # OpenAI Configuration
-    @property
+    @cached_property
     def openai_api_key(self) -> str:
         """OpenAI API key"""
-        key = os.getenv("OPENAI_API_KEY")
+        key = self._get("OPENAI_API_KEY")
         if not key:
             raise ValueError("OPENAI_API_KEY environment variable bulunamadı")
         return key
     
     # Browser Configuration
-    @property
+    @cached_property
     def browser_type(self) -> str:
         """Kullanılacak browser türü"""
-        return os.getenv("BROWSER_TYPE", "chromium")
+        return self._get("BROWSER_TYPE", "chromium")
     
-    @property
+    @cached_property
     def headless(self) -> bool:
         """Headless mod aktif mi"""
-        return os.getenv("HEADLESS", "true").lower() == "true"
+        return self._get("HEADLESS", "true").lower() == "true"
     
-    @property
+    @cached_property
     def default_timeout(self) -> int:
         """Default timeout değeri (ms)"""
-        return int(os.getenv("DEFAULT_TIMEOUT", "30000"))
+        return int(self._get("DEFAULT_TIMEOUT", "30000"))
     
-    @property
+    @cached_property
     def retry_count(self) -> int:
         """Default retry sayısı"""
-        return int(os.getenv("RETRY_COUNT", "2"))
+        return int(self._get("RETRY_COUNT", "2"))
+
+    @cached_property
+    def max_parallel_scenarios(self) -> int:
+        """Aynı anda çalıştırılacak maksimum scenario sayısı"""
+        return int(self._get("MAX_PARALLEL_SCENARIOS", "4"))
     
     # Logging Configuration
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Log seviyesi"""
-        return os.getenv("LOG_LEVEL", "INFO")
+        return self._get("LOG_LEVEL", "INFO")
     
-    @property
+    @cached_property
     def log_format(self) -> str:
         """Log format (json/text)"""
-        return os.getenv("LOG_FORMAT", "json")
+        return self._get("LOG_FORMAT", "json")
     
     # Test Data
-    @property
+    @cached_property
     def test_username(self) -> Optional[str]:
         """Test kullanıcı adı"""
-        return os.getenv("TEST_USERNAME")
+        return self._get("TEST_USERNAME")
     
-    @property
+    @cached_property
     def test_password(self) -> Optional[str]:
         """Test şifresi"""
-        return os.getenv("TEST_PASSWORD")
+        return self._get("TEST_PASSWORD")
     
     # Trace and Screenshot Configuration
-    @property
+    @cached_property
     def trace_enabled(self) -> bool:
         """Trace kayıt aktif mi"""
-        return os.getenv("TRACE_ENABLED", "true").lower() == "true"
+        return self._get("TRACE_ENABLED", "true").lower() == "true"
     
-    @property
+    @cached_property
     def screenshot_on_failure(self) -> bool:
         """Hata durumunda screenshot al"""
-        return os.getenv("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
+        return self._get("SCREENSHOT_ON_FAILURE", "true").lower() == "true"
     
     # Directories
-    @property
+    @cached_property
     def tests_dir(self) -> Path:
         """Test dosyaları dizini"""
         return Path("tests")
     
-    @property
+    @cached_property
     def traces_dir(self) -> Path:
         """Trace dosyaları dizini"""
         return Path("traces")
     
-    @property
+    @cached_property
     def screenshots_dir(self) -> Path:
         """Screenshot dizini"""
         return Path("screenshots")
     
-    @property
+    @cached_property
     def logs_dir(self) -> Path:
         """Log dosyaları dizini"""
         return Path("logs")
     
     def ensure_directories(self):
         """Gerekli dizinleri oluştur"""
-        for directory in [
-            self.tests_dir,
-            self.traces_dir, 
-            self.screenshots_dir,
-            self.logs_dir
-        ]:
+        for directory in (self.tests_dir, self.traces_dir,
+                          self.screenshots_dir, self.logs_dir):
             directory.mkdir(exist_ok=True)
     
     def get_browser_config(self) -> Dict[str, Any]:
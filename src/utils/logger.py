@@ -5,24 +5,57 @@ structlog tabanlı loglama konfigürasyonu.
 
 import structlog
 import logging
+import atexit
+import io
+import re
 import sys
+import time
 from typing import Optional
 from pathlib import Path
-from datetime import datetime
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """Kayıt başına flush yapmayan dosya handler'ı
+
+    Standart FileHandler her emit sonunda flush çağırır ve kayıt başına
+    bir write() syscall'ı üretir. Burada dosya büyük buffer'la açılır,
+    emit sadece buffer'a yazar; flush çıkışta (logging.shutdown/atexit)
+    garanti edilir. Log-yoğun koşularda syscall sayısını kayıt başına
+    birden buffer başına bire indirir.
+    """
+
+    def __init__(self, filename, encoding='utf-8', buffer_bytes=65536):
+        self._buffer_bytes = buffer_bytes
+        super().__init__(filename, encoding=encoding)
+        atexit.register(self.flush)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode,
+                    buffering=self._buffer_bytes, encoding=self.encoding)
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logging(
     level: str = "INFO",
-    format_type: str = "json", 
-    log_file: Optional[str] = None
+    format_type: str = "json",
+    log_file: Optional[str] = None,
+    buffer_bytes: int = 65536
 ) -> None:
     """
     Structured logging'i konfigüre eder
-    
+
     Args:
         level: Log seviyesi (DEBUG, INFO, WARNING, ERROR)
         format_type: Output formatı (json, text)
         log_file: Log dosyası yolu (optional)
+        buffer_bytes: Console sink buffer boyutu; 0 = buffersız.
+            TTY olmayan çıktılarda log başına bir write() syscall'ı
+            yerine kayıtlar bu buffer'da biriktirilir.
     """
     
     # Log seviyesini ayarla
@@ -72,8 +105,18 @@ def setup_logging(
     # Handler'ları ekle
     handlers = []
     
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Console handler — interaktif olmayan çıktıda buffered sink kullan,
+    # çıkışta flush garantisi atexit ile verilir
+    console_stream = sys.stdout
+    if buffer_bytes and not sys.stdout.isatty():
+        console_stream = io.TextIOWrapper(
+            io.BufferedWriter(sys.stdout.buffer, buffer_size=buffer_bytes),
+            encoding='utf-8',
+            line_buffering=False
+        )
+        atexit.register(console_stream.flush)
+
+    console_handler = logging.StreamHandler(console_stream)
     console_handler.setFormatter(formatter)
     handlers.append(console_handler)
     
@@ -82,7 +125,16 @@ def setup_logging(
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
+        # JSON log dosyaları makine tüketimine gider: blok buffer'lı yaz,
+        # flush çıkışa ertelenir. Text format canlı tail edilebilir, kayıt
+        # başına flush yapan standart handler'da kalır.
+        if format_type.lower() == "json":
+            file_handler = _BufferedFileHandler(
+                log_path, encoding='utf-8',
+                buffer_bytes=buffer_bytes or 65536
+            )
+        else:
+            file_handler = logging.FileHandler(log_path, encoding='utf-8')
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
     
@@ -114,6 +166,16 @@ def get_logger(name: str) -> structlog.BoundLogger:
     return structlog.get_logger(name)
 
 
+# Dosya adında izin verilmeyen karakterler; \w Unicode harf/rakamları da
+# kapsar, böylece Türkçe test adları korunur
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]+')
+
+# Timestamp string'i saniye çözünürlüğünde cache'lenir: aynı saniye içinde
+# art arda log dosyası açan çağrılar strftime'ı tekrarlamaz
+_last_ts_sec = 0
+_last_ts_str = ''
+
+
 def create_test_log_file(test_name: str, logs_dir: Path = Path("logs")) -> str:
     """
     Test için timestamped log dosyası oluşturur
@@ -127,12 +189,17 @@ def create_test_log_file(test_name: str, logs_dir: Path = Path("logs")) -> str:
     """
     logs_dir.mkdir(exist_ok=True)
     
-    # Timestamp ekle
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Timestamp ekle (saniye değişmediyse cache'ten)
+    global _last_ts_sec, _last_ts_str
+    sec = int(time.time())
+    if sec != _last_ts_sec:
+        _last_ts_str = time.strftime("%Y%m%d_%H%M%S", time.localtime(sec))
+        _last_ts_sec = sec
+    timestamp = _last_ts_str
     
-    # Güvenli dosya adı oluştur
-    safe_test_name = "".join(c for c in test_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-    safe_test_name = safe_test_name.replace(' ', '_')
+    # Güvenli dosya adı oluştur: tek regex substitution, karakter başına
+    # Python çağrısı yerine C'de çalışan state machine
+    safe_test_name = _UNSAFE_FILENAME_CHARS.sub('', test_name).rstrip().replace(' ', '_')
     
     log_filename = f"{safe_test_name}_{timestamp}.log"
     log_path = logs_dir / log_filename
@@ -140,6 +207,11 @@ def create_test_log_file(test_name: str, logs_dir: Path = Path("logs")) -> str:
     return str(log_path)
 
 
+# TestLogger'ın taban logger'ı bir kez çözülür; her instance sadece kendi
+# context'ini bind eder, get_logger + proxy kurulumu tekrarlanmaz
+_TEST_EXEC_LOGGER = structlog.get_logger("test_execution")
+
+
 class TestLogger:
     """
     Test execution için özelleştirilmiş logger wrapper
@@ -148,7 +220,7 @@ class TestLogger:
     def __init__(self, test_name: str, context: Optional[dict] = None):
         self.test_name = test_name
         self.context = context or {}
-        self.logger = get_logger("test_execution").bind(
+        self.logger = _TEST_EXEC_LOGGER.bind(
             test=test_name,
             **self.context
         )
@@ -168,7 +240,7 @@ class TestLogger:
         """Step başlangıcını logla"""
         self.logger.info("Step starting",
                         step_index=step_index,
-                        step_type=list(step_data.keys())[0] if step_data else "unknown")
+                        step_type=next(iter(step_data), "unknown") if step_data else "unknown")
     
     def step_success(self, step_index: int, duration: float):
         """Step başarısını logla"""
@@ -3,6 +3,11 @@ YAML Scenario Loader
 Test senaryolarını yükler ve validate eder.
 """
 
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import yaml
 from typing import Dict, Any, Optional, List
 from pathlib import Path
@@ -13,6 +18,20 @@ from ..models.scenario import Scenario
 
 logger = structlog.get_logger(__name__)
 
+# libyaml varsa C loader/dumper kullanılır; pure-Python SafeLoader'a göre
+# parse ~10x hızlıdır. Modül seviyesinde bir kez çözülür.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Parse edilmiş senaryo cache'i: (path, mtime_ns, size) değişmediği sürece
+# aynı dosya için parse+validation tekrarlanmaz. Scenario frozen olduğu
+# için cache'lenen instance güvenle paylaşılır.
+_SCENARIO_CACHE: Dict[tuple, Scenario] = {}
+_SCENARIO_CACHE_MAX = 256
+# Dizin yükleme thread havuzundan geçer; eviction (pop + next(iter)) iki
+# thread'de çakışırsa KeyError üretir, okuma/yazma kilitle korunur
+_SCENARIO_CACHE_LOCK = threading.Lock()
+
 
 class YamlLoader:
     """
@@ -33,7 +52,9 @@ class YamlLoader:
         try:
             scenario_path = Path(file_path)
             
-            if not scenario_path.exists():
+            try:
+                st = scenario_path.stat()
+            except OSError:
                 logger.error("Scenario dosyası bulunamadı", path=file_path)
                 return None
             
@@ -41,16 +62,29 @@ class YamlLoader:
                 logger.error("Dosya YAML formatında değil", path=file_path)
                 return None
             
-            # YAML dosyasını oku
-            with open(scenario_path, 'r', encoding='utf-8') as f:
-                raw_data = yaml.safe_load(f)
+            cache_key = (str(scenario_path.resolve()), st.st_mtime_ns, st.st_size)
+            with _SCENARIO_CACHE_LOCK:
+                cached = _SCENARIO_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+            
+            # YAML dosyasını tek seferde bytes olarak oku: libyaml UTF-8
+            # decode'u C tarafında yapar, TextIOWrapper katmanı atlanır
+            raw_data = yaml.load(scenario_path.read_bytes(), Loader=_Loader)
             
             if not raw_data:
                 logger.error("YAML dosyası boş", path=file_path)
                 return None
             
-            # Pydantic model ile validate et
-            scenario = Scenario(**raw_data)
+            # Pydantic model ile validate et: model_validate dict'i kwargs'a
+            # açmadan doğrudan Rust core validator'a verir
+            scenario = Scenario.model_validate(raw_data)
+            
+            with _SCENARIO_CACHE_LOCK:
+                if len(_SCENARIO_CACHE) >= _SCENARIO_CACHE_MAX:
+                    # En eski girdiyi at (dict insertion order = FIFO)
+                    _SCENARIO_CACHE.pop(next(iter(_SCENARIO_CACHE)))
+                _SCENARIO_CACHE[cache_key] = scenario
             
             logger.info("Scenario başarıyla yüklendi", 
                        path=file_path,
@@ -91,17 +125,27 @@ class YamlLoader:
             logger.error("Test dizini bulunamadı", directory=directory)
             return scenarios
         
-        # YAML dosyalarını bul
-        yaml_files = list(test_dir.glob("*.yaml")) + list(test_dir.glob("*.yml"))
+        # YAML dosyalarını tek scandir geçişiyle bul: iki glob taraması
+        # yerine bir getdents, DirEntry.is_file() da cache'li d_type okur
+        yaml_files = [
+            Path(entry.path)
+            for entry in os.scandir(test_dir)
+            if entry.is_file() and entry.name.endswith(('.yaml', '.yml'))
+        ]
         
         logger.info("YAML dosyaları bulundu", 
                    directory=directory, 
                    file_count=len(yaml_files))
         
-        for yaml_file in yaml_files:
-            scenario = YamlLoader.load_scenario(str(yaml_file))
-            if scenario:
-                scenarios.append(scenario)
+        # Parse'ı thread havuzuna dağıt: libyaml load sırasında GIL'i
+        # bıraktığı için dosyalar gerçekten paralel işlenir. ex.map sırayı
+        # korur, sonuç listesi dosya sırasıyla aynıdır.
+        if len(yaml_files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(yaml_files))) as ex:
+                results = list(ex.map(YamlLoader.load_scenario, map(str, yaml_files)))
+        else:
+            results = [YamlLoader.load_scenario(str(f)) for f in yaml_files]
+        scenarios = [s for s in results if s]
         
         logger.info("Scenariolar yüklendi", 
                    total_files=len(yaml_files),
@@ -110,16 +154,37 @@ class YamlLoader:
         return scenarios
     
     @staticmethod
-    def validate_scenario_syntax(file_path: str) -> Dict[str, Any]:
+    def validate_scenario_syntax(file_path: str, strict: bool = True) -> Dict[str, Any]:
         """
         YAML dosyasının syntax'ını kontrol eder (yüklemeden)
-        
+
+        Sonuç (path, mtime) anahtarıyla cache'lenir: dosya değişmediği
+        sürece tekrarlanan çağrılar (CI retry, watch mode) YAML'ı yeniden
+        parse etmez.
+
         Args:
             file_path: YAML dosya yolu
-            
+            strict: True ise Pydantic validation çalışır (el yazması yapı
+                kontrolleri atlanır, Pydantic hepsini kapsar); False ise
+                sadece ucuz yapısal kontroller yapılır, model kurulmaz
+
         Returns:
             Validation sonuçları
         """
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return {"valid": False, "errors": ["Dosya bulunamadı"], "warnings": []}
+
+        return _validate_scenario_cached(file_path, mtime_ns, strict)
+
+    @staticmethod
+    def _validate_scenario_uncached(file_path: str, strict: bool = True) -> Dict[str, Any]:
+        """Validation'ın cache'lenmeyen asıl implementasyonu
+
+        raw_data iki kez gezilmez: strict modda Pydantic tek otorite
+        olur, lenient modda sadece el yazması yapısal kontroller koşar.
+        """
         result = {
             "valid": False,
             "errors": [],
@@ -133,33 +198,40 @@ class YamlLoader:
                 result["errors"].append("Dosya bulunamadı")
                 return result
             
-            # YAML syntax kontrolü
-            with open(scenario_path, 'r', encoding='utf-8') as f:
-                raw_data = yaml.safe_load(f)
+            # YAML syntax kontrolü (tek seferde bytes okunur)
+            raw_data = yaml.load(scenario_path.read_bytes(), Loader=_Loader)
             
             if not raw_data:
                 result["errors"].append("YAML dosyası boş")
                 return result
             
-            # Basic structure kontrolü
             if not isinstance(raw_data, dict):
                 result["errors"].append("YAML root object dict olmalı")
                 return result
             
-            if 'steps' not in raw_data:
-                result["errors"].append("'steps' alanı gerekli")
-                return result
-            
-            if not isinstance(raw_data['steps'], list):
-                result["errors"].append("'steps' array olmalı")
+            if not strict:
+                # Ucuz yapısal kontroller; model kurulmaz
+                if 'steps' not in raw_data:
+                    result["errors"].append("'steps' alanı gerekli")
+                    return result
+                
+                if not isinstance(raw_data['steps'], list):
+                    result["errors"].append("'steps' array olmalı")
+                    return result
+                
+                if len(raw_data['steps']) == 0:
+                    result["warnings"].append("Steps listesi boş")
+                
+                result["valid"] = True
+                result["scenario_name"] = raw_data.get("name")
+                result["steps_count"] = len(raw_data['steps'])
                 return result
             
-            if len(raw_data['steps']) == 0:
-                result["warnings"].append("Steps listesi boş")
-            
-            # Pydantic validation
+            # Pydantic validation (yapısal kontrolleri de kapsar)
             try:
-                scenario = Scenario(**raw_data)
+                scenario = Scenario.model_validate(raw_data)
+                if not scenario.steps:
+                    result["warnings"].append("Steps listesi boş")
                 result["valid"] = True
                 result["scenario_name"] = scenario.name
                 result["steps_count"] = len(scenario.steps)
@@ -186,34 +258,13 @@ class YamlLoader:
         Returns:
             Başarı durumu
         """
-        example_scenario = {
-            "name": "Örnek Test Senaryosu",
-            "description": "Bu bir örnek test senaryosudur",
-            "browser": "chromium",
-            "headless": True,
-            "timeout": 30000,
-            "steps": [
-                {"goto": "https://example.com"},
-                {"fill": {"label": "Username", "value": "test_user"}},
-                {"fill": {"label": "Password", "value": "test_pass"}},
-                {"click": {"text": "Login"}},
-                {"assert_url_not_contains": "login"},
-                {"screenshot": {"name": "login_success", "full_page": False}},
-                {"click": {"text": "Dashboard"}},
-                {"wait": {"seconds": 2}},
-                {"assert_url_contains": "dashboard"}
-            ]
-        }
-        
         try:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                yaml.dump(example_scenario, f, 
-                         default_flow_style=False, 
-                         allow_unicode=True,
-                         indent=2)
+            # İçerik sabittir: ilk çağrıda bir kez serialize edilir,
+            # sonraki çağrılar hazır bytes'ı yazar
+            output_file.write_bytes(_example_scenario_bytes())
             
             logger.info("Örnek scenario oluşturuldu", path=output_path)
             return True
@@ -222,6 +273,43 @@ class YamlLoader:
             logger.error("Örnek scenario oluşturulamadı", path=output_path, error=str(e))
             return False
 
+_EXAMPLE_SCENARIO = {
+    "name": "Örnek Test Senaryosu",
+    "description": "Bu bir örnek test senaryosudur",
+    "browser": "chromium",
+    "headless": True,
+    "timeout": 30000,
+    "steps": [
+        {"goto": "https://example.com"},
+        {"fill": {"label": "Username", "value": "test_user"}},
+        {"fill": {"label": "Password", "value": "test_pass"}},
+        {"click": {"text": "Login"}},
+        {"assert_url_not_contains": "login"},
+        {"screenshot": {"name": "login_success", "full_page": False}},
+        {"click": {"text": "Dashboard"}},
+        {"wait": {"seconds": 2}},
+        {"assert_url_contains": "dashboard"}
+    ]
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _example_scenario_bytes() -> bytes:
+    """Örnek senaryonun YAML çıktısı; sabit olduğu için bir kez üretilir"""
+    return yaml.dump(_EXAMPLE_SCENARIO,
+                     Dumper=_Dumper,
+                     default_flow_style=False,
+                     allow_unicode=True,
+                     indent=2,
+                     encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_scenario_cached(file_path: str, mtime_ns: int, strict: bool) -> Dict[str, Any]:
+    """mtime anahtarlı validation cache'i (mtime değişince doğal invalidation)"""
+    return YamlLoader._validate_scenario_uncached(file_path, strict)
+
+
 # Module-level convenience functions
 def load_scenario(file_path: str) -> Optional[Scenario]:
     """Convenience function for loading a scenario"""
@@ -231,9 +319,9 @@ def load_scenarios_from_directory(directory: str) -> List[Scenario]:
     """Convenience function for loading scenarios from directory"""
     return YamlLoader.load_scenarios_from_directory(directory)
 
-def validate_scenario_syntax(file_path: str) -> Dict[str, Any]:
+def validate_scenario_syntax(file_path: str, strict: bool = True) -> Dict[str, Any]:
     """Convenience function for validating scenario syntax"""
-    return YamlLoader.validate_scenario_syntax(file_path)
+    return YamlLoader.validate_scenario_syntax(file_path, strict)
 
 def create_example_scenario(output_path: str) -> bool:
     """Convenience function for creating example scenario"""
@@ -4,6 +4,7 @@ Temel fonksiyonaliteyi test et
 CrewAI ve browser-use olmadan temel bileşenleri kontrol eder.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -106,15 +107,16 @@ def test_directory_structure():
     """Dizin yapısını kontrol et"""
     print("\n🧪 Dizin yapısı testi...")
     
-    expected_dirs = [
-        "src", "src/agents", "src/models", "src/utils",
-        "tests", "traces", "screenshots", "logs"
-    ]
+    expected_top = ["src", "tests", "traces", "screenshots", "logs"]
+    expected_src = ["agents", "models", "utils"]
+    
+    # Dizin başına stat yerine iki scandir taraması: tüm isimler iki
+    # getdents çağrısıyla toplanır
+    top = {e.name for e in os.scandir('.') if e.is_dir()}
+    src_sub = {e.name for e in os.scandir('src') if e.is_dir()} if 'src' in top else set()
     
-    missing_dirs = []
-    for dir_path in expected_dirs:
-        if not Path(dir_path).exists():
-            missing_dirs.append(dir_path)
+    missing_dirs = [d for d in expected_top if d not in top]
+    missing_dirs += [f"src/{d}" for d in expected_src if d not in src_sub]
     
     if missing_dirs:
         print(f"❌ Eksik dizinler: {missing_dirs}")